@@ -6,7 +6,7 @@ AI-powered resume analysis and optimization tool
 import asyncio
 import warnings
 
-from resumemind.core.cli import CLIInterface, CommandHandler
+from resumemind.core.cli import CommandHandler
 from resumemind.core.persistence import ProviderStateService
 from resumemind.core.utils import DisplayManager
 
@@ -17,8 +17,9 @@ class ResumeMindApp:
     """Main application class"""
 
     def __init__(self):
-        self.cli = CLIInterface()
         self.commands = CommandHandler()
+        # Share the command handler's interface instead of building a second one
+        self.cli = self.commands.interface
         self.display = DisplayManager()
         self.state_service = ProviderStateService()
 
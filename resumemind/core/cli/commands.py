@@ -5,10 +5,6 @@ Command handlers for the CLI application
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-from resumemind.core.services.resume_ingestion_service import (
-    complete_resume_ingestion_workflow_with_human_review,
-)
-
 from ..providers import ProviderConfig
 from ..utils import DisplayManager
 from .interface import CLIInterface
@@ -113,6 +109,10 @@ class CommandHandler:
 
     async def run_resume_ingestion(self):
         """Main resume analysis functionality"""
+        from ..services.resume_ingestion_service import (
+            complete_resume_ingestion_workflow_with_human_review,
+        )
+
         if not self.current_resume_path:
             self.display.print("[red]Missing resume file or analysis options.[/red]")
             return
@@ -132,6 +132,8 @@ class CommandHandler:
                     self.interface,
                 )
             )
+            # Ingestion writes to the resume store, so drop any cached listing
+            self.interface.invalidate_resume_cache()
 
             if workflow_result["success"]:
                 # Display detailed results
@@ -169,6 +171,10 @@ class CommandHandler:
                     self.display.print(
                         "\n[yellow]Resume ingestion was cancelled during the review process.[/yellow]"
                     )
+                elif workflow_result.get("already_ingested"):
+                    self.display.print(
+                        f"\n[yellow]This resume was already ingested (ID: {workflow_result['resume_id']}).[/yellow]"
+                    )
                 else:
                     self.display.print(
                         f"\n[red]Workflow failed: {workflow_result.get('error', 'Unknown error')}[/red]"
@@ -337,11 +343,12 @@ class CommandHandler:
                 if not question:
                     continue
 
-                if question.lower() == "exit":
+                command = question.lower()
+                if command == "exit":
                     self.display.print("\n[green]👋 Ending chat session[/green]")
                     break
 
-                if question.lower() == "clear":
+                if command == "clear":
                     qa_service.clear_chat_history()
                     self.display.print("\n[green]✅ Chat history cleared[/green]")
                     chat_number = 1
@@ -405,11 +412,12 @@ class CommandHandler:
                 if not question:
                     continue
 
-                if question.lower() == "exit":
+                command = question.lower()
+                if command == "exit":
                     self.display.print("\n[green]👋 Ending chat session[/green]")
                     break
 
-                if question.lower() == "clear":
+                if command == "clear":
                     qa_service.clear_chat_history()
                     self.display.print("\n[green]✅ Chat history cleared[/green]")
                     chat_number = 1
@@ -2,19 +2,212 @@
 CLI interface for provider selection and configuration
 """
 
+import asyncio
 import os
+import stat
+import time
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Callable, Dict, Generator, List, Optional, Sequence, Tuple
 
 from rich.prompt import Confirm, Prompt
 from rich.table import Table
+from rich.text import Text
 
-from ..persistence.resume_storage_service import ResumeStorageService
-from ..providers import LLMProviders, ProviderConfig
+from ..persistence.resume_storage_service import (
+    ResumeStorageService,
+    get_resume_storage,
+)
+from ..providers import ProviderConfig
 from ..providers.manager import ProviderManager
 from ..utils import DisplayManager
 
+# Ordered for display; the frozenset is used for membership checks
+SUPPORTED_FORMATS = (".pdf", ".docx", ".doc", ".txt")
+_SUPPORTED_FORMAT_SET = frozenset(SUPPORTED_FORMATS)
+_FORMATS_HELP = f"[dim]Supported formats: {', '.join(SUPPORTED_FORMATS)}[/dim]"
+
+# Accepted spellings of single-key navigation choices
+_BACK_TOKENS = frozenset({"b", "B"})
+_NEXT_TOKENS = frozenset({"n", "N"})
+_PREV_TOKENS = frozenset({"p", "P"})
+
+# Number of resumes shown per page in selection lists
+PAGE_SIZE = 20
+
+# Number of triplets shown in the review table
+TRIPLET_PAGE_SIZE = 20
+
+# Seconds a cached list of completed resumes may be reused between menu visits
+RESUME_CACHE_TTL = 30.0
+
+STATUS_MAP = {
+    "completed": "✅ Done",
+    "pending": "⏳ Pending",
+    "failed": "❌ Failed",
+}
+
+
+# Static menus and help blocks are parsed from markup once at import time
+_MAIN_MENU_OPTIONS = (
+    ("1", "📄 Resume Ingestion"),
+    ("2", "📚 View Ingested Resumes"),
+    ("3", "✨ Resume Optimizer"),
+    ("4", "💬 Ask Questions (Q&A)"),
+    ("5", "🤖 Manage Providers"),
+    ("6", "❌ Exit"),
+)
+_MAIN_MENU_CHOICES = [key for key, _ in _MAIN_MENU_OPTIONS]
+
+_QA_MENU_OPTIONS = (
+    ("1", "💬 Ask about a specific resume"),
+    ("2", "🔍 Search across all resumes"),
+    ("3", "⬅️  Back to main menu"),
+)
+_QA_MENU_CHOICES = [key for key, _ in _QA_MENU_OPTIONS]
+
+_REVIEW_MENU_OPTIONS = (
+    ("1", "✅ Approve and continue with ingestion"),
+    ("2", "📝 Add specific information to look for"),
+    ("3", "🗑️  Remove specific triplets"),
+    ("4", "👀 View detailed triplet information"),
+    ("5", "❌ Cancel ingestion"),
+)
+_REVIEW_MENU_CHOICES = [key for key, _ in _REVIEW_MENU_OPTIONS]
+
+_RESUMES_MENU_OPTIONS = (
+    ("1", "View resume details"),
+    ("2", "Delete a resume"),
+    ("3", "Back to main menu"),
+)
+_RESUMES_MENU_CHOICES = [key for key, _ in _RESUMES_MENU_OPTIONS]
+
+_MAIN_MENU = Text.from_markup(
+    "\n[bold cyan]🎯 ResumeMindAI - Main Menu[/bold cyan]\n"
+    "[dim]Choose what you'd like to do:[/dim]\n\n"
+    + "\n".join(f"  {key}. {label}" for key, label in _MAIN_MENU_OPTIONS)
+)
+
+_QA_MENU = Text.from_markup(
+    "\n[bold cyan]💬 Resume Q&A[/bold cyan]\n"
+    "[dim]Choose how you'd like to ask questions:[/dim]\n\n"
+    + "\n".join(f"  {key}. {label}" for key, label in _QA_MENU_OPTIONS)
+)
+
+_REVIEW_MENU = Text.from_markup(
+    "\n[bold yellow]Review Options:[/bold yellow]\n"
+    + "\n".join(f"  {key}. {label}" for key, label in _REVIEW_MENU_OPTIONS)
+)
+
+_RESUMES_MENU = Text.from_markup(
+    "\n[bold]Options:[/bold]\n"
+    + "\n".join(f"  {key}. {label}" for key, label in _RESUMES_MENU_OPTIONS)
+)
+
+_OPTIMIZATION_CONTEXT_HELP = Text.from_markup(
+    "\n[bold cyan]📝 Additional Context (Optional)[/bold cyan]\n"
+    "[dim]Provide any additional context to help with optimization:[/dim]\n"
+    "[dim]Examples:[/dim]\n"
+    "[dim]  • Target role: Senior Software Engineer at FAANG[/dim]\n"
+    "[dim]  • Industry: Machine Learning / AI[/dim]\n"
+    "[dim]  • Focus areas: Leadership, technical depth[/dim]\n"
+    "[dim]  • Career goals: Transition to management[/dim]\n"
+)
+
+_RESUME_QUESTION_HELP = Text.from_markup(
+    "\n[bold cyan]💬 Ask a Question About This Resume[/bold cyan]\n"
+    "[dim]Examples:[/dim]\n"
+    "[dim]  • What are the key technical skills?[/dim]\n"
+    "[dim]  • What companies has this person worked at?[/dim]\n"
+    "[dim]  • Summarize the work experience[/dim]\n"
+    "[dim]  • What projects has this person worked on?[/dim]\n"
+    "[dim]  • What is the educational background?[/dim]\n"
+)
+
+_GENERAL_QUESTION_HELP = Text.from_markup(
+    "\n[bold cyan]💬 Ask a Question Across All Resumes[/bold cyan]\n"
+    "[dim]Examples:[/dim]\n"
+    "[dim]  • Who has experience with Python and machine learning?[/dim]\n"
+    "[dim]  • Find candidates with cloud computing skills[/dim]\n"
+    "[dim]  • Who has worked at FAANG companies?[/dim]\n"
+    "[dim]  • List all candidates with PhD degrees[/dim]\n"
+)
+
+# Suggestion priorities in display order with their section headers
+_PRIORITY_SECTIONS = (
+    ("HIGH", Text("🔴 HIGH Priority Optimizations", style="bold red")),
+    ("MEDIUM", Text("🟡 MEDIUM Priority Optimizations", style="bold yellow")),
+    ("LOW", Text("🔵 LOW Priority Optimizations", style="bold blue")),
+)
+
+# Optional triplet description attributes and their labels in the detail view
+_TRIPLET_DESCRIPTION_FIELDS = (
+    ("subject_description", "Subject"),
+    ("object_description", "Object"),
+    ("relationship_description", "Relationship"),
+)
+
+
+def _fmt_size(size_bytes: int) -> str:
+    """Format a byte count as kilobytes for display"""
+    return f"{size_bytes / 1024:.1f} KB"
+
+
+def _truncate(value: str, length: int) -> str:
+    """Shorten a table cell to at most length characters, ending in an ellipsis"""
+    return value if len(value) <= length else value[: length - 1] + "…"
+
+
+def _triplet_signature(triplet) -> Tuple[str, str, str]:
+    """Identity of a triplet used for de-duplication"""
+    return (triplet.subject, triplet.predicate, triplet.object)
+
+
+def _validate_resume_path(file_path: str) -> Tuple[bool, Optional[str], Optional[Path]]:
+    """
+    Validate a user-supplied resume file path.
+
+    Args:
+        file_path: Raw path as typed by the user
+
+    Returns:
+        Tuple of (ok, error_message, resolved_path). resolved_path is also set
+        for existing files with an unsupported extension so callers can allow
+        the user to proceed anyway.
+    """
+    file_path = file_path.strip()
+    if not file_path:
+        return False, "[yellow]No file path provided.[/yellow]", None
+
+    # A single stat answers both "exists" and "is a regular file"
+    expanded_path = Path(os.path.expanduser(file_path))
+    try:
+        st = os.stat(expanded_path)
+    except (FileNotFoundError, NotADirectoryError):
+        return False, f"[red]❌ File not found: {expanded_path.absolute()}[/red]", None
+
+    if not stat.S_ISREG(st.st_mode):
+        return (
+            False,
+            f"[red]❌ Path is not a file: {expanded_path.absolute()}[/red]",
+            None,
+        )
+
+    # Resolve only once the path is known to be valid
+    resolved_path = expanded_path.resolve()
+
+    file_extension = resolved_path.suffix.lower()
+    if file_extension not in _SUPPORTED_FORMAT_SET:
+        return (
+            False,
+            f"[yellow]⚠️  Unsupported file format: {file_extension}[/yellow]\n"
+            + _FORMATS_HELP,
+            resolved_path,
+        )
+
+    return True, None, resolved_path
+
 
 class CLIInterface:
     """Handles CLI interactions for provider selection"""
@@ -22,91 +215,34 @@ class CLIInterface:
     def __init__(self):
         self.display = DisplayManager()
         self.provider_manager = ProviderManager()
+        self._storage_service = None
+        # (fetched at, pages by offset); dropped by invalidate_resume_cache()
+        # after ingestion or deletion, otherwise reused until RESUME_CACHE_TTL
+        self._resume_cache: Optional[
+            Tuple[float, Dict[int, List[Tuple[str, str, Optional[str]]]]]
+        ] = None
+
+    @property
+    def storage_service(self) -> ResumeStorageService:
+        """Lazily create and reuse the resume storage service"""
+        if self._storage_service is None:
+            self._storage_service = get_resume_storage()
+        return self._storage_service
+
+    def invalidate_resume_cache(self):
+        """Drop the cached resume list so the next menu visit refetches it"""
+        self._resume_cache = None
 
     def select_model(self) -> Tuple[Optional[ProviderConfig], Optional[dict]]:
         """Select or configure a LiteLLM model using the provider manager"""
         return self.provider_manager.get_or_create_provider()
 
-    def get_custom_model_config(self) -> Tuple[ProviderConfig, dict]:
-        """Get custom model configuration from user with embedding support"""
-        self.display.print("\n[bold cyan]🤖 LiteLLM Model Configuration[/bold cyan]")
-        self.display.print(
-            "[dim]Configure any model supported by LiteLLM. Examples:[/dim]"
-        )
-        self.display.print("[dim]• OpenAI: gpt-4o, gpt-4, gpt-3.5-turbo[/dim]")
-        self.display.print(
-            "[dim]• Anthropic: claude-3-5-sonnet-20241022, claude-3-opus-20240229[/dim]"
-        )
-        self.display.print(
-            "[dim]• Google: gemini/gemini-1.5-pro, gemini/gemini-pro[/dim]"
-        )
-        self.display.print("[dim]• Ollama: ollama/llama3.2, ollama/mistral[/dim]")
-        self.display.print(
-            "[dim]• And many more providers supported by LiteLLM[/dim]\n"
-        )
-
-        # LLM Configuration
-        model = Prompt.ask("Enter model name")
-        api_key = Prompt.ask(
-            "Enter API key (optional for local models like Ollama)", default=""
-        )
-        base_url = Prompt.ask(
-            "Enter base URL (optional, e.g., http://localhost:11434 for Ollama)",
-            default="",
-        )
-
-        # Embedding Configuration
-        self.display.print("\n[bold cyan]🔍 Embedding Configuration[/bold cyan]")
-        self.display.print(
-            "[dim]Configure embedding model for GraphRAG support. Examples:[/dim]"
-        )
-        self.display.print(
-            "[dim]• OpenAI: text-embedding-3-small, text-embedding-3-large[/dim]"
-        )
-        self.display.print(
-            "[dim]• Ollama: ollama/nomic-embed-text, ollama/mxbai-embed-large[/dim]"
-        )
-        self.display.print("[dim]• Google: text-embedding-004[/dim]")
-        self.display.print(
-            "[dim]• Leave empty for auto-selection based on your LLM model[/dim]\n"
-        )
-
-        embedding_model = Prompt.ask("Enter embedding model (optional)", default="")
-        embedding_api_key = Prompt.ask(
-            "Enter embedding API key (optional, will use LLM key if empty)", default=""
-        )
-        embedding_base_url = Prompt.ask(
-            "Enter embedding base URL (optional, will use LLM URL if empty)", default=""
-        )
-
-        return LLMProviders.create_custom_config(
-            model=model,
-            api_key=api_key if api_key else None,
-            base_url=base_url if base_url else None,
-            embedding_model=embedding_model if embedding_model else None,
-            embedding_api_key=embedding_api_key if embedding_api_key else None,
-            embedding_base_url=embedding_base_url if embedding_base_url else None,
-        )
-
     def show_main_menu(self) -> str:
         """Display main application menu and get user choice"""
-        self.display.print("\n[bold cyan]🎯 ResumeMindAI - Main Menu[/bold cyan]")
-        self.display.print("[dim]Choose what you'd like to do:[/dim]\n")
-
-        menu_options = {
-            "1": "📄 Resume Ingestion",
-            "2": "📚 View Ingested Resumes",
-            "3": "✨ Resume Optimizer",
-            "4": "💬 Ask Questions (Q&A)",
-            "5": "🤖 Manage Providers",
-            "6": "❌ Exit",
-        }
-
-        for key, value in menu_options.items():
-            self.display.print(f"  {key}. {value}")
+        self.display.console.print(_MAIN_MENU)
 
         choice = Prompt.ask(
-            "\nSelect an option", choices=list(menu_options.keys()), default="1"
+            "\nSelect an option", choices=_MAIN_MENU_CHOICES, default="1"
         )
 
         return choice
@@ -120,50 +256,19 @@ class CLIInterface:
         self.display.print("\n[bold yellow]📄 Resume File Selection[/bold yellow]")
         self.display.print("[dim]Please provide your resume file for analysis.[/dim]\n")
 
-        supported_formats = [".pdf", ".docx", ".doc", ".txt"]
-        self.display.print(
-            f"[dim]Supported formats: {', '.join(supported_formats)}[/dim]"
-        )
+        self.display.print(_FORMATS_HELP)
 
         while True:
             file_path = Prompt.ask("Enter the path to your resume file", default="")
+            ok, error, resolved_path = _validate_resume_path(file_path)
 
-            if not file_path.strip():
-                if not Confirm.ask(
-                    "No file path provided. Would you like to try again?"
+            if not ok:
+                self.display.print(error)
+                # Unsupported formats may still be readable, so allow an override
+                if not (
+                    resolved_path and Confirm.ask("Would you like to proceed anyway?")
                 ):
-                    return None
-                continue
-
-            # Expand user path and resolve
-            expanded_path = os.path.expanduser(file_path.strip())
-            resolved_path = Path(expanded_path).resolve()
-
-            # Validate file exists
-            if not resolved_path.exists():
-                self.display.print(f"[red]❌ File not found: {resolved_path}[/red]")
-                if not Confirm.ask("Would you like to try a different path?"):
-                    return None
-                continue
-
-            # Validate file is actually a file
-            if not resolved_path.is_file():
-                self.display.print(f"[red]❌ Path is not a file: {resolved_path}[/red]")
-                if not Confirm.ask("Would you like to try a different path?"):
-                    return None
-                continue
-
-            # Validate file format
-            file_extension = resolved_path.suffix.lower()
-            if file_extension not in supported_formats:
-                self.display.print(
-                    f"[yellow]⚠️  Unsupported file format: {file_extension}[/yellow]"
-                )
-                self.display.print(
-                    f"[dim]Supported formats: {', '.join(supported_formats)}[/dim]"
-                )
-                if not Confirm.ask("Would you like to proceed anyway?"):
-                    if not Confirm.ask("Would you like to try a different file?"):
+                    if not Confirm.ask("Would you like to try again?", default=True):
                         return None
                     continue
 
@@ -200,26 +305,27 @@ class CLIInterface:
         # Show summary statistics
         self._display_triplet_summary(graph_data)
 
+        # Signatures of triplets already in the set, kept across extraction rounds
+        signatures = {_triplet_signature(t) for t in graph_data.triplets}
+
         # Main review menu
         while True:
-            self.display.print("\n[bold yellow]Review Options:[/bold yellow]")
-            self.display.print("  1. ✅ Approve and continue with ingestion")
-            self.display.print("  2. 📝 Add specific information to look for")
-            self.display.print("  3. 🗑️  Remove specific triplets")
-            self.display.print("  4. 👀 View detailed triplet information")
-            self.display.print("  5. ❌ Cancel ingestion")
+            self.display.console.print(_REVIEW_MENU)
 
             choice = Prompt.ask(
-                "\nSelect an option", choices=["1", "2", "3", "4", "5"], default="1"
+                "\nSelect an option", choices=_REVIEW_MENU_CHOICES, default="1"
             )
 
             if choice == "1":
-                # Check if there are additional extraction requests to process
-                if (
-                    graph_data.additional_extraction_requests
-                    and formatted_resume
-                    and graph_extractor
-                ):
+                # Common case: nothing was requested, approve straight away
+                if not graph_data.additional_extraction_requests:
+                    self.display.print(
+                        "[green]✅ Triplets approved for ingestion![/green]"
+                    )
+                    return True
+
+                # Process the pending additional extraction requests
+                if formatted_resume and graph_extractor:
                     self.display.print(
                         "\n[yellow]🔄 Processing additional extraction requests...[/yellow]"
                     )
@@ -234,23 +340,15 @@ class CLIInterface:
                         )
 
                         if additional_triplets:
-                            # Create a set of existing triplet signatures for deduplication
-                            existing_signatures = set()
-                            for triplet in graph_data.triplets:
-                                signature = f"{triplet.subject}|{triplet.predicate}|{triplet.object}"
-                                existing_signatures.add(signature)
-
-                            # Filter out duplicates from additional triplets
-                            unique_additional = []
+                            # Append only triplets not already in the set
+                            triplets = graph_data.triplets
+                            first_new = len(triplets)
                             for triplet in additional_triplets:
-                                signature = f"{triplet.subject}|{triplet.predicate}|{triplet.object}"
-                                if signature not in existing_signatures:
-                                    unique_additional.append(triplet)
-                                    existing_signatures.add(signature)
-
-                            # Append only unique triplets
-                            graph_data.triplets.extend(unique_additional)
-                            added_count = len(unique_additional)
+                                signature = _triplet_signature(triplet)
+                                if signature not in signatures:
+                                    signatures.add(signature)
+                                    triplets.append(triplet)
+                            added_count = len(triplets) - first_new
 
                             if added_count > 0:
                                 self.display.print(
@@ -268,7 +366,7 @@ class CLIInterface:
                                 self.display.print(
                                     "\n[bold cyan]🆕 Newly Added Triplets:[/bold cyan]"
                                 )
-                                self._display_triplets_table(unique_additional)
+                                self._display_triplets_table(triplets[first_new:])
                             else:
                                 self.display.print(
                                     "[yellow]📝 All extracted triplets were duplicates - no new information added[/yellow]"
@@ -316,6 +414,7 @@ class CLIInterface:
                 self._handle_add_information_request(graph_data)
             elif choice == "3":
                 self._handle_remove_triplets(graph_data)
+                signatures = {_triplet_signature(t) for t in graph_data.triplets}
             elif choice == "4":
                 self._show_detailed_triplet_view(graph_data)
             elif choice == "5":
@@ -324,7 +423,16 @@ class CLIInterface:
                     return False
 
     def _display_triplets_table(self, triplets):
-        """Display triplets in a formatted table"""
+        """Display the first page of triplets in a formatted table"""
+        self._render_triplets_page(triplets, 0, TRIPLET_PAGE_SIZE)
+
+        if len(triplets) > TRIPLET_PAGE_SIZE:
+            self.display.print(
+                f"[dim]... and {len(triplets) - TRIPLET_PAGE_SIZE} more triplets (use option 4 to view all)[/dim]"
+            )
+
+    def _render_triplets_page(self, triplets, offset: int, page_size: int):
+        """Display one page of triplets, building rows only for that slice"""
         table = Table(
             title="Extracted Graph Triplets",
             show_header=True,
@@ -336,76 +444,46 @@ class CLIInterface:
         table.add_column("Object", style="green", width=20)
         table.add_column("Types", style="dim", width=15)
 
-        for i, triplet in enumerate(triplets[:20], 1):  # Show first 20 triplets
-            subject_type = (
-                triplet.subject_type[:8] + "..."
-                if len(triplet.subject_type) > 8
-                else triplet.subject_type
-            )
-            object_type = (
-                triplet.object_type[:8] + "..."
-                if len(triplet.object_type) > 8
-                else triplet.object_type
-            )
-            types_str = f"{subject_type} → {object_type}"
-
-            table.add_row(
+        truncate = _truncate
+        add_row = table.add_row
+        for i, triplet in enumerate(triplets[offset : offset + page_size], offset + 1):
+            add_row(
                 str(i),
-                triplet.subject[:18] + "..."
-                if len(triplet.subject) > 18
-                else triplet.subject,
-                triplet.predicate[:18] + "..."
-                if len(triplet.predicate) > 18
-                else triplet.predicate,
-                triplet.object[:18] + "..."
-                if len(triplet.object) > 18
-                else triplet.object,
-                types_str,
+                truncate(triplet.subject, 18),
+                truncate(triplet.predicate, 18),
+                truncate(triplet.object, 18),
+                f"{truncate(triplet.subject_type, 8)} → {truncate(triplet.object_type, 8)}",
             )
 
         self.display.print(table)
 
-        if len(triplets) > 20:
-            self.display.print(
-                f"[dim]... and {len(triplets) - 20} more triplets (use option 4 to view all)[/dim]"
-            )
-
     def _display_triplet_summary(self, graph_data):
         """Display summary statistics about the extracted triplets"""
         triplets = graph_data.triplets
 
-        # Count entities by type
-        entity_types = {}
-        relationships = set()
-
-        for triplet in triplets:
-            # Count subject types
-            entity_types[triplet.subject_type] = (
-                entity_types.get(triplet.subject_type, 0) + 1
-            )
-            # Count object types (avoid double counting)
-            if triplet.object_type != triplet.subject_type:
-                entity_types[triplet.object_type] = (
-                    entity_types.get(triplet.object_type, 0) + 1
-                )
-            # Collect relationship types
-            relationships.add(triplet.predicate)
-
-        self.display.print("\n[bold]📊 Summary:[/bold]")
-        self.display.print(f"[dim]• Total triplets: {len(triplets)}[/dim]")
-        self.display.print(
-            f"[dim]• Unique relationship types: {len(relationships)}[/dim]"
+        # Count entities by type (object types only when they differ from the subject)
+        entity_types = Counter(t.subject_type for t in triplets)
+        entity_types.update(
+            t.object_type for t in triplets if t.object_type != t.subject_type
         )
-        self.display.print(f"[dim]• Entity types found: {len(entity_types)}[/dim]")
+        relationships = {t.predicate for t in triplets}
+
+        lines = [
+            "\n[bold]📊 Summary:[/bold]",
+            f"[dim]• Total triplets: {len(triplets)}[/dim]",
+            f"[dim]• Unique relationship types: {len(relationships)}[/dim]",
+            f"[dim]• Entity types found: {len(entity_types)}[/dim]",
+        ]
 
         # Show top entity types
         if entity_types:
-            sorted_types = sorted(
-                entity_types.items(), key=lambda x: x[1], reverse=True
+            lines.append("[dim]• Top entity types:[/dim]")
+            lines.extend(
+                f"[dim]  - {entity_type}: {count}[/dim]"
+                for entity_type, count in entity_types.most_common(5)
             )
-            self.display.print("[dim]• Top entity types:[/dim]")
-            for entity_type, count in sorted_types[:5]:
-                self.display.print(f"[dim]  - {entity_type}: {count}[/dim]")
+
+        self.display.print("\n".join(lines))
 
     def _handle_add_information_request(self, graph_data):
         """Handle user request to specify additional information to extract"""
@@ -458,27 +536,30 @@ class CLIInterface:
 
         if remove_input.strip():
             try:
-                # Parse the input
-                indices_to_remove = [
-                    int(x.strip()) - 1
-                    for x in remove_input.split(",")
-                    if x.strip().isdigit()
-                ]
-                indices_to_remove = [
-                    i for i in indices_to_remove if 0 <= i < len(graph_data.triplets)
-                ]
+                # Parse the input, keeping only numbers that refer to a triplet
+                total = len(graph_data.triplets)
+                indices_to_remove = {
+                    int(x) - 1 for x in remove_input.split(",") if x.strip().isdigit()
+                }
+                indices_to_remove = {i for i in indices_to_remove if 0 <= i < total}
 
                 if indices_to_remove:
-                    # Remove triplets (in reverse order to maintain indices)
-                    for i in sorted(indices_to_remove, reverse=True):
-                        removed_triplet = graph_data.triplets.pop(i)
-                        self.display.print(
-                            f"[red]❌ Removed: {removed_triplet.subject} → {removed_triplet.predicate} → {removed_triplet.object}[/red]"
-                        )
+                    # Rebuild the list in one pass rather than popping each index
+                    kept = []
+                    lines = []
+                    for i, triplet in enumerate(graph_data.triplets):
+                        if i in indices_to_remove:
+                            lines.append(
+                                f"[red]❌ Removed: {triplet.subject} → {triplet.predicate} → {triplet.object}[/red]"
+                            )
+                        else:
+                            kept.append(triplet)
+                    graph_data.triplets[:] = kept
 
-                    self.display.print(
+                    lines.append(
                         f"[green]✅ Removed {len(indices_to_remove)} triplet(s)[/green]"
                     )
+                    self.display.print("\n".join(lines))
                 else:
                     self.display.print(
                         "[yellow]No valid triplet numbers provided.[/yellow]"
@@ -503,60 +584,34 @@ class CLIInterface:
         page_size = 5
         total_triplets = len(graph_data.triplets)
         current_page = 0
+        pages: Dict[int, Text] = {}
 
         while True:
             start_idx = current_page * page_size
             end_idx = min(start_idx + page_size, total_triplets)
 
-            self.display.print(
-                f"\n[bold]Triplets {start_idx + 1}-{end_idx} of {total_triplets}:[/bold]"
-            )
-
-            for i in range(start_idx, end_idx):
-                triplet = graph_data.triplets[i]
-                self.display.print(
-                    f"\n[bold cyan]{i + 1}. {triplet.subject} → {triplet.predicate} → {triplet.object}[/bold cyan]"
-                )
-                self.display.print(
-                    f"[dim]   Subject Type: {triplet.subject_type}[/dim]"
+            # Pages are rebuilt only the first time they are visited
+            page = pages.get(current_page)
+            if page is None:
+                page = pages[current_page] = self._build_triplet_detail_page(
+                    graph_data.triplets, start_idx, end_idx
                 )
-                self.display.print(f"[dim]   Object Type: {triplet.object_type}[/dim]")
-                if (
-                    hasattr(triplet, "subject_description")
-                    and triplet.subject_description
-                ):
-                    self.display.print(
-                        f"[dim]   Subject: {triplet.subject_description}[/dim]"
-                    )
-                if (
-                    hasattr(triplet, "object_description")
-                    and triplet.object_description
-                ):
-                    self.display.print(
-                        f"[dim]   Object: {triplet.object_description}[/dim]"
-                    )
-                if (
-                    hasattr(triplet, "relationship_description")
-                    and triplet.relationship_description
-                ):
-                    self.display.print(
-                        f"[dim]   Relationship: {triplet.relationship_description}[/dim]"
-                    )
+            self.display.console.print(page)
 
             # Navigation options
-            nav_options = []
-            if current_page > 0:
-                nav_options.append("p")
-            if end_idx < total_triplets:
-                nav_options.append("n")
-            nav_options.append("b")
-
-            nav_prompt = "Navigation: "
-            if "p" in nav_options:
-                nav_prompt += "[p]revious, "
-            if "n" in nav_options:
-                nav_prompt += "[n]ext, "
-            nav_prompt += "[b]ack to review menu"
+            has_prev = current_page > 0
+            has_next = end_idx < total_triplets
+            nav = [
+                (key, label)
+                for key, label, enabled in (
+                    ("p", "[p]revious", has_prev),
+                    ("n", "[n]ext", has_next),
+                    ("b", "[b]ack to review menu", True),
+                )
+                if enabled
+            ]
+            nav_options = [key for key, _ in nav]
+            nav_prompt = "Navigation: " + ", ".join(label for _, label in nav)
 
             choice = Prompt.ask(nav_prompt, choices=nav_options, default="b")
 
@@ -567,9 +622,48 @@ class CLIInterface:
             elif choice == "b":
                 break
 
+    def _build_triplet_detail_page(
+        self, triplets, start_idx: int, end_idx: int
+    ) -> Text:
+        """Build one page of the detailed triplet view as a single renderable"""
+        lines = [
+            Text(
+                f"\nTriplets {start_idx + 1}-{end_idx} of {len(triplets)}:",
+                style="bold",
+            )
+        ]
+        # All triplets share one model class, so probe its optional fields once
+        sample = triplets[start_idx]
+        description_fields = [
+            (attr, label)
+            for attr, label in _TRIPLET_DESCRIPTION_FIELDS
+            if hasattr(sample, attr)
+        ]
+
+        for i in range(start_idx, end_idx):
+            triplet = triplets[i]
+            lines.append(
+                Text(
+                    f"\n{i + 1}. {triplet.subject} → {triplet.predicate} → {triplet.object}",
+                    style="bold cyan",
+                )
+            )
+            details = [
+                f"   Subject Type: {triplet.subject_type}",
+                f"   Object Type: {triplet.object_type}",
+            ]
+
+            for attr, label in description_fields:
+                value = getattr(triplet, attr)
+                if value:
+                    details.append(f"   {label}: {value}")
+            lines.append(Text("\n".join(details), style="dim"))
+
+        return Text("\n").join(lines)
+
     def display_ingested_resumes(self):
         """Display all ingested resumes from the database"""
-        storage_service = ResumeStorageService()
+        storage_service = self.storage_service
 
         self.display.print("\n[bold cyan]📚 Ingested Resumes[/bold cyan]")
         self.display.print("[dim]All resumes stored in the database[/dim]\n")
@@ -611,50 +705,40 @@ class CLIInterface:
         resumes_table.add_column("Graph", justify="center", width=8)
         resumes_table.add_column("Created", width=20)
 
-        for resume in all_resumes:
-            # Format file size
-            size_kb = resume.file_size / 1024
-            size_str = f"{size_kb:.1f} KB"
-
-            # Status emoji
-            status_map = {
-                "completed": "✅ Done",
-                "pending": "⏳ Pending",
-                "failed": "❌ Failed",
-            }
-            status_str = status_map.get(
-                resume.ingestion_status, resume.ingestion_status
-            )
+        add_row = resumes_table.add_row
+        status_label = STATUS_MAP.get
 
-            # Graph ingested
-            graph_str = "✅" if resume.graph_ingested else "❌"
+        for resume in all_resumes:
+            created_at = resume.created_at
 
             # Format date
             try:
-                created_dt = datetime.fromisoformat(resume.created_at)
-                created_str = created_dt.strftime("%Y-%m-%d %H:%M")
+                created_str = datetime.fromisoformat(created_at).strftime(
+                    "%Y-%m-%d %H:%M"
+                )
             except Exception:
-                created_str = resume.created_at[:16] if resume.created_at else "N/A"
+                created_str = created_at[:16] if created_at else "N/A"
 
-            resumes_table.add_row(
+            status = resume.ingestion_status
+
+            add_row(
                 resume.resume_id[:12],
                 resume.file_name[:30],
                 resume.file_type.upper(),
-                size_str,
-                status_str,
-                graph_str,
+                _fmt_size(resume.file_size),
+                status_label(status, status),
+                "✅" if resume.graph_ingested else "❌",
                 created_str,
             )
 
         self.display.console.print(resumes_table)
 
         # Show options
-        self.display.print("\n[bold]Options:[/bold]")
-        self.display.print("  1. View resume details")
-        self.display.print("  2. Delete a resume")
-        self.display.print("  3. Back to main menu")
+        self.display.console.print(_RESUMES_MENU)
 
-        choice = Prompt.ask("\nSelect an option", choices=["1", "2", "3"], default="3")
+        choice = Prompt.ask(
+            "\nSelect an option", choices=_RESUMES_MENU_CHOICES, default="3"
+        )
 
         if choice == "1":
             self._view_resume_details(storage_service, all_resumes)
@@ -672,7 +756,7 @@ class CLIInterface:
 
         choice = Prompt.ask("\nEnter resume number (or 'b' to go back)", default="b")
 
-        if choice.lower() == "b":
+        if choice in _BACK_TOKENS:
             return
 
         try:
@@ -700,7 +784,7 @@ class CLIInterface:
         details_table.add_row("File Name", resume.file_name)
         details_table.add_row("File Path", resume.file_path)
         details_table.add_row("File Type", resume.file_type.upper())
-        details_table.add_row("File Size", f"{resume.file_size / 1024:.1f} KB")
+        details_table.add_row("File Size", _fmt_size(resume.file_size))
         details_table.add_row("Status", resume.ingestion_status)
         details_table.add_row(
             "Graph Ingested", "Yes" if resume.graph_ingested else "No"
@@ -734,54 +818,183 @@ class CLIInterface:
             "[dim]This will only remove the database entry, not the original file.[/dim]\n"
         )
 
-        for idx, resume in enumerate(all_resumes, 1):
-            self.display.print(f"  {idx}. {resume.file_name} ({resume.resume_id[:12]})")
+        def render_page(page_resumes, offset):
+            self.display.print(
+                "\n".join(
+                    f"  {idx}. {resume.file_name} ({resume.resume_id[:12]})"
+                    for idx, resume in enumerate(page_resumes, offset + 1)
+                )
+            )
 
-        choice = Prompt.ask(
-            "\nEnter resume number to delete (or 'b' to go back)", default="b"
+        resume = self._select_paginated(
+            len(all_resumes),
+            lambda offset: all_resumes[offset : offset + PAGE_SIZE],
+            render_page,
+            "Enter resume number to delete",
         )
-
-        if choice.lower() == "b":
+        if resume is None:
             return
 
+        if Confirm.ask(
+            f"\nAre you sure you want to delete '{resume.file_name}'?",
+            default=False,
+        ):
+            if storage_service.delete_resume(resume.resume_id):
+                self.invalidate_resume_cache()
+                self.display.print("[green]✅ Resume deleted successfully.[/green]")
+            else:
+                self.display.print("[red]❌ Failed to delete resume.[/red]")
+
+    def _select_paginated(
+        self,
+        total: int,
+        fetch_page: Callable[[int], Sequence[Any]],
+        render_page: Callable[[Sequence[Any], int], None],
+        prompt: str,
+    ) -> Optional[Any]:
+        """
+        Let the user pick one item from a list rendered PAGE_SIZE rows at a time.
+
+        Item numbers are global, so a number from any page in 1..total selects
+        that item; invalid input re-prompts instead of leaving the picker.
+
+        Args:
+            total: Total number of selectable items
+            fetch_page: Returns the items starting at the given offset
+            render_page: Displays a page of items given the page and its offset
+            prompt: Prompt text shown for the item number
+
+        Returns:
+            The selected item, or None if the user went back
+        """
+        picker = self._paginate(total, render_page, prompt)
         try:
-            idx = int(choice) - 1
-            if 0 <= idx < len(all_resumes):
-                resume = all_resumes[idx]
+            offset = next(picker)
+            while True:
+                offset = picker.send(fetch_page(offset))
+        except StopIteration as done:
+            return done.value
+
+    async def _select_paginated_async(
+        self,
+        total: int,
+        fetch_page: Callable[[int], Sequence[Any]],
+        render_page: Callable[[Sequence[Any], int], None],
+        prompt: str,
+    ) -> Optional[Any]:
+        """
+        Same as _select_paginated, but page fetches run in a worker thread.
 
-                if Confirm.ask(
-                    f"\nAre you sure you want to delete '{resume.file_name}'?",
-                    default=False,
-                ):
-                    if storage_service.delete_resume(resume.resume_id):
-                        self.display.print(
-                            "[green]✅ Resume deleted successfully.[/green]"
-                        )
-                    else:
-                        self.display.print("[red]❌ Failed to delete resume.[/red]")
-            else:
-                self.display.print("[red]Invalid selection.[/red]")
-        except ValueError:
-            self.display.print("[red]Invalid input.[/red]")
+        Prompts stay on the event-loop thread, so Ctrl+C interrupts them
+        directly and only the database reads leave the loop.
+        """
+        picker = self._paginate(total, render_page, prompt)
+        try:
+            offset = next(picker)
+            while True:
+                offset = picker.send(await asyncio.to_thread(fetch_page, offset))
+        except StopIteration as done:
+            return done.value
+
+    def _paginate(
+        self,
+        total: int,
+        render_page: Callable[[Sequence[Any], int], None],
+        prompt: str,
+    ) -> Generator[int, Sequence[Any], Optional[Any]]:
+        """Picker loop shared by both drivers; yields an offset to get its page"""
+        total_pages = max(1, -(-total // PAGE_SIZE))
+        page = 0
+        choices = "'b' to go back"
+        if total_pages > 1:
+            choices = "'n'/'p' to change page, " + choices
+
+        # Only redraw when the page changes, so error messages stay visible
+        needs_render = True
+        while True:
+            offset = page * PAGE_SIZE
+            if needs_render:
+                items = yield offset
+                render_page(items, offset)
+                if total_pages > 1:
+                    self.display.print(
+                        f"[dim]Page {page + 1} of {total_pages} ({total} resumes)[/dim]"
+                    )
+                needs_render = False
+
+            choice = Prompt.ask(f"\n{prompt} (or {choices})", default="b")
+
+            if choice in _BACK_TOKENS:
+                return None
+            if choice in _NEXT_TOKENS:
+                if page + 1 < total_pages:
+                    page += 1
+                    needs_render = True
+                else:
+                    self.display.print("[yellow]Already on the last page.[/yellow]")
+                continue
+            if choice in _PREV_TOKENS:
+                if page > 0:
+                    page -= 1
+                    needs_render = True
+                else:
+                    self.display.print("[yellow]Already on the first page.[/yellow]")
+                continue
+
+            try:
+                number = int(choice)
+            except ValueError:
+                self.display.print("[red]Invalid input.[/red]")
+                continue
+
+            if not 1 <= number <= total:
+                self.display.print(
+                    f"[red]Invalid selection. Enter a number from 1 to {total}.[/red]"
+                )
+                continue
+
+            # The number may belong to another page; fetch that page if so
+            idx = number - 1 - offset
+            if not 0 <= idx < len(items):
+                page_offset = (number - 1) // PAGE_SIZE * PAGE_SIZE
+                items = yield page_offset
+                idx = number - 1 - page_offset
+            if 0 <= idx < len(items):
+                return items[idx]
+
+            self.display.print("[red]Invalid selection.[/red]")
+
+    def _get_completed_resumes_page(
+        self, offset: int
+    ) -> List[Tuple[str, str, Optional[str]]]:
+        """Get a page of completed resumes, reusing recently fetched pages"""
+        cached = self._resume_cache
+        if not cached or time.monotonic() - cached[0] >= RESUME_CACHE_TTL:
+            cached = self._resume_cache = (time.monotonic(), {})
+
+        pages = cached[1]
+        if offset not in pages:
+            pages[offset] = list(
+                self.storage_service.iter_completed_resumes(
+                    limit=PAGE_SIZE, offset=offset
+                )
+            )
+        return pages[offset]
 
     async def select_resume_for_optimization(self) -> Optional[str]:
         """
         Display list of completed resumes and let user select one for optimization.
 
+        Database reads run in a worker thread; prompts stay on the event loop.
+
         Returns:
             Resume ID if selected, None if cancelled
         """
-        from ..persistence.resume_storage_service import ResumeStorageService
-
-        storage_service = ResumeStorageService()
-        all_resumes = storage_service.get_all_resumes()
-
-        # Convert to dictionaries and filter to only completed resumes
-        completed_resumes = [
-            r.to_dict() for r in all_resumes if r.ingestion_status == "completed"
-        ]
+        total = await asyncio.to_thread(
+            self.storage_service.get_resume_count, "completed"
+        )
 
-        if not completed_resumes:
+        if not total:
             self.display.print(
                 "\n[yellow]⚠️  No completed resumes found. Please ingest a resume first.[/yellow]"
             )
@@ -793,44 +1006,48 @@ class CLIInterface:
         )
         self.display.print("[dim]Choose a resume to analyze and optimize:[/dim]\n")
 
-        # Display resumes in a table
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("#", style="dim", width=4)
-        table.add_column("File Name", style="cyan")
-        table.add_column("Ingested", style="green")
-        table.add_column("Resume ID", style="dim")
-
-        for idx, resume in enumerate(completed_resumes, 1):
-            ingested_date = resume.get("ingested_at", "N/A")
-            if ingested_date != "N/A":
-                ingested_date = datetime.fromisoformat(ingested_date).strftime(
-                    "%Y-%m-%d %H:%M"
-                )
-
-            table.add_row(
-                str(idx),
-                resume.get("file_name", "Unknown"),
-                ingested_date,
-                resume.get("resume_id", "")[:12] + "...",
+        def render_page(page_resumes, offset):
+            # Display resumes in a table
+            # Fixed column widths let Rich skip measuring every cell
+            table = Table(
+                show_header=True,
+                header_style="bold magenta",
+                expand=False,
+                pad_edge=False,
+            )
+            table.add_column("#", style="dim", width=4)
+            table.add_column(
+                "File Name", style="cyan", width=40, no_wrap=True, overflow="ellipsis"
+            )
+            table.add_column("Ingested", style="green", width=16, no_wrap=True)
+            table.add_column(
+                "Resume ID", style="dim", width=15, no_wrap=True, overflow="ellipsis"
             )
 
-        self.display.console.print(table)
+            for idx, (resume_id, file_name, ingested_at) in enumerate(
+                page_resumes, offset + 1
+            ):
+                # ISO timestamps already start with "YYYY-MM-DDTHH:MM"
+                ingested_date = (
+                    ingested_at[:16].replace("T", " ") if ingested_at else "N/A"
+                )
 
-        choice = Prompt.ask("\nEnter resume number (or 'b' to go back)", default="b")
+                table.add_row(
+                    str(idx),
+                    file_name or "Unknown",
+                    ingested_date,
+                    resume_id,
+                )
 
-        if choice.lower() == "b":
-            return None
+            self.display.console.print(table)
 
-        try:
-            idx = int(choice) - 1
-            if 0 <= idx < len(completed_resumes):
-                return completed_resumes[idx].get("resume_id")
-            else:
-                self.display.print("[red]Invalid selection.[/red]")
-                return None
-        except ValueError:
-            self.display.print("[red]Invalid input.[/red]")
-            return None
+        resume = await self._select_paginated_async(
+            total,
+            self._get_completed_resumes_page,
+            render_page,
+            "Enter resume number",
+        )
+        return resume[0] if resume else None
 
     def get_optimization_context(self) -> Optional[str]:
         """
@@ -839,23 +1056,14 @@ class CLIInterface:
         Returns:
             Additional context string or None
         """
-        self.display.print("\n[bold cyan]📝 Additional Context (Optional)[/bold cyan]")
-        self.display.print(
-            "[dim]Provide any additional context to help with optimization:[/dim]"
-        )
-        self.display.print("[dim]Examples:[/dim]")
-        self.display.print(
-            "[dim]  • Target role: Senior Software Engineer at FAANG[/dim]"
-        )
-        self.display.print("[dim]  • Industry: Machine Learning / AI[/dim]")
-        self.display.print("[dim]  • Focus areas: Leadership, technical depth[/dim]")
-        self.display.print("[dim]  • Career goals: Transition to management[/dim]\n")
+        self.display.console.print(_OPTIMIZATION_CONTEXT_HELP)
 
         context = Prompt.ask(
             "Enter additional context (or press Enter to skip)", default=""
         )
 
-        return context.strip() if context.strip() else None
+        context = context.strip()
+        return context if context else None
 
     def display_optimization_results(self, optimization_output):
         """
@@ -864,88 +1072,100 @@ class CLIInterface:
         Args:
             optimization_output: ResumeOptimizationOutput object
         """
-        self.display.print("\n" + "=" * 80)
-        self.display.print(
-            "[bold cyan]✨ Resume Optimization Analysis Complete[/bold cyan]"
-        )
-        self.display.print("=" * 80 + "\n")
-
-        # Overall Assessment
-        self.display.print("[bold yellow]📊 Overall Assessment[/bold yellow]")
-        self.display.print(f"{optimization_output.overall_assessment}\n")
+        # Styled Text pieces skip markup parsing, so model output containing
+        # brackets (e.g. "[Skills]") is shown verbatim
+        lines = [
+            Text("\n" + "=" * 80),
+            Text("✨ Resume Optimization Analysis Complete", style="bold cyan"),
+            Text("=" * 80 + "\n"),
+            # Overall Assessment
+            Text("📊 Overall Assessment", style="bold yellow"),
+            Text(f"{optimization_output.overall_assessment}\n"),
+        ]
 
         # Strengths
-        if optimization_output.strengths:
-            self.display.print("[bold green]💪 Key Strengths[/bold green]")
-            for idx, strength in enumerate(optimization_output.strengths, 1):
-                self.display.print(f"  {idx}. {strength}")
-            self.display.print()
+        strengths = optimization_output.strengths
+        if strengths:
+            lines.append(Text("💪 Key Strengths", style="bold green"))
+            lines.extend(
+                Text(f"  {idx}. {strength}")
+                for idx, strength in enumerate(strengths, 1)
+            )
+            lines.append(Text())
 
         # ATS Compatibility
         score = optimization_output.ats_score
         score_color = "green" if score >= 80 else "yellow" if score >= 60 else "red"
-        self.display.print(
-            f"[bold {score_color}]🎯 ATS Score: {score}/100[/bold {score_color}]\n"
-        )
+        lines.append(Text(f"🎯 ATS Score: {score}/100\n", style=f"bold {score_color}"))
 
         # Optimization Suggestions by Priority
-        if optimization_output.optimization_suggestions:
-            self._display_optimization_suggestions(
-                optimization_output.optimization_suggestions
-            )
+        suggestions = optimization_output.optimization_suggestions
+        if suggestions:
+            lines.extend(self._format_optimization_suggestions(suggestions))
 
         # Missing Information
-        if optimization_output.missing_information:
-            self._display_missing_information(optimization_output.missing_information)
+        missing_information = optimization_output.missing_information
+        if missing_information:
+            lines.extend(self._format_missing_information(missing_information))
 
         # Top Actions
-        if optimization_output.top_actions:
-            self.display.print("[bold magenta]🚀 Top Actions[/bold magenta]")
-            for idx, action in enumerate(optimization_output.top_actions, 1):
-                self.display.print(f"  {idx}. {action}")
-            self.display.print()
+        top_actions = optimization_output.top_actions
+        if top_actions:
+            lines.append(Text("🚀 Top Actions", style="bold magenta"))
+            lines.extend(
+                Text(f"  {idx}. {action}") for idx, action in enumerate(top_actions, 1)
+            )
+            lines.append(Text())
 
-        self.display.print("=" * 80 + "\n")
+        lines.append(Text("=" * 80 + "\n"))
+        self.display.console.print(Text("\n").join(lines))
         Prompt.ask("Press Enter to continue", default="")
 
-    def _display_optimization_suggestions(self, suggestions):
-        """Display optimization suggestions grouped by priority"""
-        # Group by priority
-        high_priority = [s for s in suggestions if s.priority == "HIGH"]
-        medium_priority = [s for s in suggestions if s.priority == "MEDIUM"]
-        low_priority = [s for s in suggestions if s.priority == "LOW"]
+    def _format_optimization_suggestions(self, suggestions) -> List[Text]:
+        """Format optimization suggestions grouped by priority"""
+        # Group by priority in a single pass; unknown priorities are skipped
+        buckets = {priority: [] for priority, _ in _PRIORITY_SECTIONS}
+        for suggestion in suggestions:
+            bucket = buckets.get(suggestion.priority)
+            if bucket is not None:
+                bucket.append(suggestion)
 
-        if high_priority:
-            self.display.print("[bold red]🔴 HIGH Priority Optimizations[/bold red]")
-            for idx, suggestion in enumerate(high_priority, 1):
-                self._display_single_suggestion(idx, suggestion)
+        lines = []
 
-        if medium_priority:
-            self.display.print(
-                "[bold yellow]🟡 MEDIUM Priority Optimizations[/bold yellow]"
+        for priority, header in _PRIORITY_SECTIONS:
+            items = buckets[priority]
+            if not items:
+                continue
+            lines.append(header)
+            lines.extend(
+                self._format_single_suggestion(idx, suggestion)
+                for idx, suggestion in enumerate(items, 1)
             )
-            for idx, suggestion in enumerate(medium_priority, 1):
-                self._display_single_suggestion(idx, suggestion)
 
-        if low_priority:
-            self.display.print("[bold blue]🔵 LOW Priority Optimizations[/bold blue]")
-            for idx, suggestion in enumerate(low_priority, 1):
-                self._display_single_suggestion(idx, suggestion)
+        return lines
 
-    def _display_single_suggestion(self, idx, suggestion):
-        """Display a single optimization suggestion"""
-        self.display.print(
-            f"\n  {idx}. [{suggestion.category}] {suggestion.suggestion}"
+    def _format_single_suggestion(self, idx, suggestion) -> Text:
+        """Format a single optimization suggestion"""
+        return Text.assemble(
+            f"\n  {idx}. [{suggestion.category}] {suggestion.suggestion}\n     ",
+            (suggestion.rationale, "dim"),
+            "\n",
         )
-        self.display.print(f"     [dim]{suggestion.rationale}[/dim]\n")
 
-    def _display_missing_information(self, missing_info):
-        """Display missing information"""
-        self.display.print("[bold orange]❓ Missing Information[/bold orange]\n")
+    def _format_missing_information(self, missing_info) -> List[Text]:
+        """Format missing information"""
+        lines = [Text("❓ Missing Information\n", style="bold orange")]
+
+        lines.extend(
+            Text.assemble(
+                f"  {idx}. [{info.category}] {info.what_missing}\n     ",
+                (info.why_important, "dim"),
+                "\n",
+            )
+            for idx, info in enumerate(missing_info, 1)
+        )
 
-        for idx, info in enumerate(missing_info, 1):
-            self.display.print(f"  {idx}. [{info.category}] {info.what_missing}")
-            self.display.print(f"     [dim]{info.why_important}[/dim]\n")
+        return lines
 
     async def ask_resume_question(self) -> Optional[Tuple[str, str]]:
         """
@@ -959,22 +1179,15 @@ class CLIInterface:
         if not resume_id:
             return None
 
-        self.display.print(
-            "\n[bold cyan]💬 Ask a Question About This Resume[/bold cyan]"
-        )
-        self.display.print("[dim]Examples:[/dim]")
-        self.display.print("[dim]  • What are the key technical skills?[/dim]")
-        self.display.print("[dim]  • What companies has this person worked at?[/dim]")
-        self.display.print("[dim]  • Summarize the work experience[/dim]")
-        self.display.print("[dim]  • What projects has this person worked on?[/dim]")
-        self.display.print("[dim]  • What is the educational background?[/dim]\n")
+        self.display.console.print(_RESUME_QUESTION_HELP)
 
         question = Prompt.ask("Enter your question (or 'b' to go back)", default="b")
 
-        if question.lower() == "b" or not question.strip():
+        stripped = question.strip()
+        if question in _BACK_TOKENS or not stripped:
             return None
 
-        return (resume_id, question.strip())
+        return (resume_id, stripped)
 
     def ask_general_question(self) -> Optional[str]:
         """
@@ -983,41 +1196,36 @@ class CLIInterface:
         Returns:
             Question string or None if cancelled
         """
-        self.display.print(
-            "\n[bold cyan]💬 Ask a Question Across All Resumes[/bold cyan]"
-        )
-        self.display.print("[dim]Examples:[/dim]")
-        self.display.print(
-            "[dim]  • Who has experience with Python and machine learning?[/dim]"
-        )
-        self.display.print("[dim]  • Find candidates with cloud computing skills[/dim]")
-        self.display.print("[dim]  • Who has worked at FAANG companies?[/dim]")
-        self.display.print("[dim]  • List all candidates with PhD degrees[/dim]\n")
+        self.display.console.print(_GENERAL_QUESTION_HELP)
 
         question = Prompt.ask("Enter your question (or 'b' to go back)", default="b")
 
-        if question.lower() == "b" or not question.strip():
+        stripped = question.strip()
+        if question in _BACK_TOKENS or not stripped:
             return None
 
-        return question.strip()
+        return stripped
 
     def display_qa_answer(
         self, question: str, answer: str, show_separator: bool = True
     ):
         """Display Q&A answer in a formatted way"""
+        lines = []
         if show_separator:
-            self.display.print("\n" + "=" * 80)
-            self.display.print("[bold cyan]💬 Question & Answer[/bold cyan]")
-            self.display.print("=" * 80 + "\n")
+            lines.append("\n" + "=" * 80)
+            lines.append("[bold cyan]💬 Question & Answer[/bold cyan]")
+            lines.append("=" * 80 + "\n")
 
-        self.display.print("[bold yellow]❓ Question:[/bold yellow]")
-        self.display.print(f"{question}\n")
+        lines.append("[bold yellow]❓ Question:[/bold yellow]")
+        lines.append(f"{question}\n")
 
-        self.display.print("[bold green]✅ Answer:[/bold green]")
-        self.display.print(f"{answer}\n")
+        lines.append("[bold green]✅ Answer:[/bold green]")
+        lines.append(f"{answer}\n")
 
         if show_separator:
-            self.display.print("=" * 80 + "\n")
+            lines.append("=" * 80 + "\n")
+
+        self.display.print("\n".join(lines))
 
     def ask_chat_question(self, chat_number: int = 1) -> Optional[str]:
         """
@@ -1036,27 +1244,13 @@ class CLIInterface:
 
         question = Prompt.ask("You", default="")
 
-        if not question.strip():
-            return None
-
-        return question.strip()
+        question = question.strip()
+        return question if question else None
 
     def show_qa_menu(self) -> str:
         """Display Q&A submenu"""
-        self.display.print("\n[bold cyan]💬 Resume Q&A[/bold cyan]")
-        self.display.print("[dim]Choose how you'd like to ask questions:[/dim]\n")
-
-        menu_options = {
-            "1": "💬 Ask about a specific resume",
-            "2": "🔍 Search across all resumes",
-            "3": "⬅️  Back to main menu",
-        }
+        self.display.console.print(_QA_MENU)
 
-        for key, value in menu_options.items():
-            self.display.print(f"  {key}. {value}")
-
-        choice = Prompt.ask(
-            "\nSelect an option", choices=list(menu_options.keys()), default="1"
-        )
+        choice = Prompt.ask("\nSelect an option", choices=_QA_MENU_CHOICES, default="1")
 
         return choice
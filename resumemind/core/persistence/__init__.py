@@ -4,7 +4,7 @@ Persistence layer for ResumeMindAI CLI
 
 from .models import ProviderModel
 from .resume_models import ResumeDataModel
-from .resume_storage_service import ResumeStorageService
+from .resume_storage_service import ResumeStorageService, get_resume_storage
 from .service import ProviderStateService
 
 __all__ = [
@@ -12,4 +12,5 @@ __all__ = [
     "ProviderStateService",
     "ResumeDataModel",
     "ResumeStorageService",
+    "get_resume_storage",
 ]
@@ -5,13 +5,29 @@ Database models for provider persistence
 import json
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, Optional, Sequence, Tuple
 
 from ..providers.base import ProviderType
 from ..providers.config import ProviderConfig
 
+# Direct value -> member map, skipping Enum.__call__ on every conversion
+_PROVIDER_TYPES = MappingProxyType({member.value: member for member in ProviderType})
 
-@dataclass
+
+@lru_cache(maxsize=128)
+def _loads_cached(raw: str) -> Dict[str, Any]:
+    """Decode a JSON parameter string"""
+    return json.loads(raw)
+
+
+def _loads(raw: str) -> Dict[str, Any]:
+    """Decode JSON parameters, returning a copy callers are free to modify"""
+    return dict(_loads_cached(raw))
+
+
+@dataclass(slots=True)
 class ProviderModel:
     """Database model for provider configuration with embedding support"""
 
@@ -34,20 +50,30 @@ class ProviderModel:
     created_at: Optional[str] = None
     updated_at: Optional[str] = None
 
+    # Insert column order matching to_params()
+    FIELD_ORDER: ClassVar[Tuple[str, ...]] = (
+        "name",
+        "provider_type",
+        "model",
+        "api_key_env",
+        "base_url",
+        "additional_params",
+        "embedding_model",
+        "embedding_api_key_env",
+        "embedding_base_url",
+        "embedding_additional_params",
+        "is_active",
+        "is_default",
+        "created_at",
+        "updated_at",
+    )
+
     @classmethod
     def from_provider_config(
         cls, config: ProviderConfig, is_active: bool = False, is_default: bool = False
     ) -> "ProviderModel":
         """Create ProviderModel from ProviderConfig"""
-        additional_params_json = None
-        if config.additional_params:
-            additional_params_json = json.dumps(config.additional_params)
-
-        embedding_additional_params_json = None
-        if config.embedding_additional_params:
-            embedding_additional_params_json = json.dumps(
-                config.embedding_additional_params
-            )
+        now = datetime.now().isoformat()
 
         return cls(
             name=config.name,
@@ -55,30 +81,31 @@ class ProviderModel:
             model=config.model,
             api_key_env=config.api_key_env,
             base_url=config.base_url,
-            additional_params=additional_params_json,
+            additional_params=config.additional_params_json,
             embedding_model=config.embedding_model,
             embedding_api_key_env=config.embedding_api_key_env,
             embedding_base_url=config.embedding_base_url,
-            embedding_additional_params=embedding_additional_params_json,
+            embedding_additional_params=config.embedding_additional_params_json,
             is_active=is_active,
             is_default=is_default,
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat(),
+            created_at=now,
+            updated_at=now,
         )
 
     def to_provider_config(self) -> ProviderConfig:
         """Convert ProviderModel to ProviderConfig"""
         additional_params = None
         if self.additional_params:
-            additional_params = json.loads(self.additional_params)
+            additional_params = _loads(self.additional_params)
 
         embedding_additional_params = None
         if self.embedding_additional_params:
-            embedding_additional_params = json.loads(self.embedding_additional_params)
+            embedding_additional_params = _loads(self.embedding_additional_params)
 
         return ProviderConfig(
             name=self.name,
-            provider_type=ProviderType(self.provider_type),
+            provider_type=_PROVIDER_TYPES.get(self.provider_type)
+            or ProviderType(self.provider_type),
             model=self.model,
             api_key_env=self.api_key_env,
             base_url=self.base_url,
@@ -89,6 +116,25 @@ class ProviderModel:
             embedding_additional_params=embedding_additional_params,
         )
 
+    def to_params(self) -> Tuple[Any, ...]:
+        """Return column values in FIELD_ORDER for parameterized inserts"""
+        return (
+            self.name,
+            self.provider_type,
+            self.model,
+            self.api_key_env,
+            self.base_url,
+            self.additional_params,
+            self.embedding_model,
+            self.embedding_api_key_env,
+            self.embedding_base_url,
+            self.embedding_additional_params,
+            self.is_active,
+            self.is_default,
+            self.created_at,
+            self.updated_at,
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for database operations"""
         return {
@@ -108,6 +154,11 @@ class ProviderModel:
             "updated_at": self.updated_at,
         }
 
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "ProviderModel":
+        """Create ProviderModel from a row selected as (id, *FIELD_ORDER)"""
+        return cls(*row)
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ProviderModel":
         """Create ProviderModel from dictionary"""
@@ -6,13 +6,16 @@ import hashlib
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Sequence, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class ResumeDataModel:
     """Database model for resume data storage"""
 
+    # Field order mirrors the resumes table columns so rows can be unpacked
+    # positionally into the constructor
+
     id: Optional[int] = None
     resume_id: str = ""  # Unique hash-based identifier
     file_name: str = ""
@@ -42,32 +45,80 @@ class ResumeDataModel:
         raw_content: str,
         cleaned_content: str = "",
         resume_id: Optional[str] = None,
+        raw_bytes: Optional[bytes] = None,
+        content_hash: Optional[str] = None,
     ) -> "ResumeDataModel":
-        """Create ResumeDataModel from file data"""
+        """
+        Create ResumeDataModel from file data
+
+        Args:
+            file_path: Path of the source file
+            raw_content: Extracted resume text
+            cleaned_content: Cleaned/formatted content, if already available
+            resume_id: Explicit identifier; derived from path and content if omitted
+            raw_bytes: UTF-8 encoding of raw_content, when the caller already has
+                it, so the content is hashed without encoding it again
+            content_hash: SHA-256 hex digest of raw_content, when the caller
+                already computed it, so the content is not hashed again
+        """
         path = Path(file_path)
+        absolute_path = str(path.absolute())
 
-        # Generate content hash
-        content_hash = hashlib.sha256(raw_content.encode()).hexdigest()
+        # Generate content hash unless the caller already has it
+        if content_hash is None:
+            content_hash = hashlib.sha256(
+                raw_bytes if raw_bytes is not None else raw_content.encode()
+            ).hexdigest()
 
-        # Generate resume_id if not provided
+        # Generate resume_id if not provided: a 64-bit BLAKE2b of the path keyed
+        # by the content digest yields the 16 hex characters directly
         if resume_id is None:
-            resume_id = hashlib.sha256(
-                f"{path.absolute()}{content_hash}".encode()
-            ).hexdigest()[:16]
+            resume_id = hashlib.blake2b(
+                absolute_path.encode(),
+                key=bytes.fromhex(content_hash),
+                digest_size=8,
+            ).hexdigest()
+
+        # One stat both checks existence and reads the size
+        try:
+            file_size = path.stat().st_size
+        except OSError:
+            file_size = 0
+
+        now = datetime.now().isoformat()
 
         return cls(
             resume_id=resume_id,
             file_name=path.name,
-            file_path=str(path.absolute()),
-            file_size=path.stat().st_size if path.exists() else 0,
+            file_path=absolute_path,
+            file_size=file_size,
             file_type=path.suffix.lstrip(".").lower(),
             raw_content=raw_content,
             cleaned_content=cleaned_content,
             content_hash=content_hash,
             ingestion_status="pending",
             graph_ingested=False,
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat(),
+            created_at=now,
+            updated_at=now,
+        )
+
+    def to_tuple(self) -> Tuple[Any, ...]:
+        """Return column values in insert order for parameterized statements"""
+        return (
+            self.resume_id,
+            self.file_name,
+            self.file_path,
+            self.file_size,
+            self.file_type,
+            self.raw_content,
+            self.cleaned_content,
+            self.content_hash,
+            self.ingestion_status,
+            self.graph_ingested,
+            self.error_message,
+            self.created_at,
+            self.updated_at,
+            self.ingested_at,
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -110,12 +161,16 @@ class ResumeDataModel:
             ingested_at=data.get("ingested_at"),
         )
 
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "ResumeDataModel":
+        """Create ResumeDataModel from a full resumes table row"""
+        return cls(*row)
+
     def mark_completed(self):
         """Mark resume as successfully ingested"""
         self.ingestion_status = "completed"
         self.graph_ingested = True
-        self.ingested_at = datetime.now().isoformat()
-        self.updated_at = datetime.now().isoformat()
+        self.ingested_at = self.updated_at = datetime.now().isoformat()
 
     def mark_failed(self, error_message: str):
         """Mark resume ingestion as failed"""
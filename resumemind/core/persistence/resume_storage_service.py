@@ -2,12 +2,72 @@
 MySQL service for resume data persistence
 """
 
+import atexit
 import sqlite3
+import threading
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
 from .resume_models import ResumeDataModel
 
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+_INSERT_RESUME_SQL = """
+    INSERT INTO resumes (
+        resume_id, file_name, file_path, file_size, file_type,
+        raw_content, cleaned_content, content_hash,
+        ingestion_status, graph_ingested, error_message,
+        created_at, updated_at, ingested_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Same insert, but an existing resume_id is updated in place (keeping its
+# created_at) and the row id is returned either way
+_UPSERT_RESUME_SQL = (
+    _INSERT_RESUME_SQL
+    + """
+    ON CONFLICT(resume_id) DO UPDATE SET
+        file_name = excluded.file_name,
+        file_path = excluded.file_path,
+        file_size = excluded.file_size,
+        file_type = excluded.file_type,
+        raw_content = excluded.raw_content,
+        cleaned_content = excluded.cleaned_content,
+        content_hash = excluded.content_hash,
+        ingestion_status = excluded.ingestion_status,
+        graph_ingested = excluded.graph_ingested,
+        error_message = excluded.error_message,
+        updated_at = excluded.updated_at,
+        ingested_at = excluded.ingested_at
+    RETURNING id
+"""
+)
+
+_UPDATE_RESUME_SQL = """
+    UPDATE resumes SET
+        file_name = ?, file_path = ?, file_size = ?, file_type = ?,
+        raw_content = ?, cleaned_content = ?, content_hash = ?,
+        ingestion_status = ?, graph_ingested = ?, error_message = ?,
+        updated_at = ?, ingested_at = ?
+    WHERE id = ?
+"""
+
+# Rows pulled from the cursor per fetchmany() call when streaming models
+FETCH_BATCH_SIZE = 512
+
+
+def _iter_models(cursor: sqlite3.Cursor) -> Iterator[ResumeDataModel]:
+    """Yield resume models from an executed cursor one batch at a time"""
+    from_row = ResumeDataModel.from_row
+    while rows := cursor.fetchmany(FETCH_BATCH_SIZE):
+        yield from map(from_row, rows)
+
 
 class ResumeStorageService:
     """
@@ -15,24 +75,13 @@ class ResumeStorageService:
     Uses SQLite for simplicity and portability, can be upgraded to MySQL later.
     """
 
-    _instance = None
-
-    def __new__(cls):
-        """Singleton pattern to ensure single database connection"""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
-
     def __init__(self):
-        """Initialize the service"""
-        if self._initialized:
-            return
-
+        """Initialize the service; use get_resume_storage() for the shared one"""
         self.db_path = self._get_db_path()
         self.conn = None
-        self._initialized = True
         self._ensure_database()
+        # Close before interpreter teardown rather than from a finalizer
+        atexit.register(self.close)
 
     def _get_db_path(self) -> Path:
         """Get the database file path"""
@@ -44,16 +93,32 @@ class ResumeStorageService:
     def _ensure_database(self):
         """Ensure database and tables exist"""
         try:
-            self.conn = sqlite3.connect(str(self.db_path))
+            # The optimizer's resume picker runs its page reads through
+            # asyncio.to_thread and awaits each one before touching the
+            # connection again, so it is never used from two threads at once.
+            # Autocommit mode: single statements commit on their own and
+            # multi-statement writes open an explicit transaction
+            self.conn = sqlite3.connect(
+                str(self.db_path), check_same_thread=False, isolation_level=None
+            )
             self.conn.row_factory = sqlite3.Row
+            self._configure_connection()
             self._create_tables()
         except Exception as e:
             print(f"Error initializing database: {e}")
             raise
 
+    def _configure_connection(self):
+        """Apply SQLite pragmas for faster commits and reads"""
+        # WAL avoids an fsync of the rollback journal on every commit; with WAL,
+        # synchronous=NORMAL is still safe against application crashes
+        for pragma in _CONNECTION_PRAGMAS:
+            self.conn.execute(pragma)
+
     def _create_tables(self):
         """Create necessary tables if they don't exist"""
         cursor = self.conn.cursor()
+        cursor.execute("BEGIN")
 
         # Create resumes table
         cursor.execute("""
@@ -79,16 +144,31 @@ class ResumeStorageService:
         # Create indexes for better query performance
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_resume_id ON resumes(resume_id)")
         cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_ingestion_status ON resumes(ingestion_status)"
+            "CREATE INDEX IF NOT EXISTS idx_created_at ON resumes(created_at)"
         )
+
         cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_graph_ingested ON resumes(graph_ingested)"
+            "CREATE INDEX IF NOT EXISTS idx_content_hash ON resumes(content_hash)"
         )
+
+        # Composite indexes cover both the filter and the sort of the listing
+        # queries; they supersede the old single-column status/graph indexes
+        cursor.execute("DROP INDEX IF EXISTS idx_ingestion_status")
+        cursor.execute("DROP INDEX IF EXISTS idx_graph_ingested")
         cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_created_at ON resumes(created_at)"
+            "CREATE INDEX IF NOT EXISTS idx_status_created "
+            "ON resumes(ingestion_status, created_at DESC)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_status_ingested "
+            "ON resumes(ingestion_status, ingested_at DESC)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_ingested_sort "
+            "ON resumes(graph_ingested, ingested_at DESC)"
         )
 
-        self.conn.commit()
+        cursor.execute("COMMIT")
 
     def save_resume(self, resume: ResumeDataModel) -> ResumeDataModel:
         """
@@ -100,78 +180,35 @@ class ResumeStorageService:
         Returns:
             ResumeDataModel with updated id
         """
+        # Each branch is a single statement, which commits on its own
         cursor = self.conn.cursor()
 
-        try:
-            if resume.id is None:
-                # Insert new resume
-                cursor.execute(
-                    """
-                    INSERT INTO resumes (
-                        resume_id, file_name, file_path, file_size, file_type,
-                        raw_content, cleaned_content, content_hash,
-                        ingestion_status, graph_ingested, error_message,
-                        created_at, updated_at, ingested_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        resume.resume_id,
-                        resume.file_name,
-                        resume.file_path,
-                        resume.file_size,
-                        resume.file_type,
-                        resume.raw_content,
-                        resume.cleaned_content,
-                        resume.content_hash,
-                        resume.ingestion_status,
-                        resume.graph_ingested,
-                        resume.error_message,
-                        resume.created_at,
-                        resume.updated_at,
-                        resume.ingested_at,
-                    ),
-                )
-                resume.id = cursor.lastrowid
-            else:
-                # Update existing resume
-                cursor.execute(
-                    """
-                    UPDATE resumes SET
-                        file_name = ?, file_path = ?, file_size = ?, file_type = ?,
-                        raw_content = ?, cleaned_content = ?, content_hash = ?,
-                        ingestion_status = ?, graph_ingested = ?, error_message = ?,
-                        updated_at = ?, ingested_at = ?
-                    WHERE id = ?
-                """,
-                    (
-                        resume.file_name,
-                        resume.file_path,
-                        resume.file_size,
-                        resume.file_type,
-                        resume.raw_content,
-                        resume.cleaned_content,
-                        resume.content_hash,
-                        resume.ingestion_status,
-                        resume.graph_ingested,
-                        resume.error_message,
-                        resume.updated_at,
-                        resume.ingested_at,
-                        resume.id,
-                    ),
-                )
-
-            self.conn.commit()
-            return resume
-
-        except sqlite3.IntegrityError as e:
-            # Handle duplicate resume_id
-            if "UNIQUE constraint failed" in str(e):
-                # Resume already exists, update it instead
-                existing = self.get_resume_by_resume_id(resume.resume_id)
-                if existing:
-                    resume.id = existing.id
-                    return self.save_resume(resume)
-            raise
+        if resume.id is None:
+            # Insert, or update the row that already has this resume_id
+            cursor.execute(_UPSERT_RESUME_SQL, resume.to_tuple())
+            resume.id = cursor.fetchone()[0]
+        else:
+            # Update existing resume
+            cursor.execute(
+                _UPDATE_RESUME_SQL,
+                (
+                    resume.file_name,
+                    resume.file_path,
+                    resume.file_size,
+                    resume.file_type,
+                    resume.raw_content,
+                    resume.cleaned_content,
+                    resume.content_hash,
+                    resume.ingestion_status,
+                    resume.graph_ingested,
+                    resume.error_message,
+                    resume.updated_at,
+                    resume.ingested_at,
+                    resume.id,
+                ),
+            )
+
+        return resume
 
     def get_resume_by_id(self, resume_id: int) -> Optional[ResumeDataModel]:
         """Get resume by database ID"""
@@ -180,7 +217,7 @@ class ResumeStorageService:
         row = cursor.fetchone()
 
         if row:
-            return ResumeDataModel.from_dict(dict(row))
+            return ResumeDataModel.from_row(row)
         return None
 
     def get_resume_by_resume_id(self, resume_id: str) -> Optional[ResumeDataModel]:
@@ -190,9 +227,38 @@ class ResumeStorageService:
         row = cursor.fetchone()
 
         if row:
-            return ResumeDataModel.from_dict(dict(row))
+            return ResumeDataModel.from_row(row)
         return None
 
+    def content_hash_exists(
+        self, content_hash: str, status: Optional[str] = None
+    ) -> Optional[int]:
+        """
+        Look up a resume by the SHA-256 of its raw content.
+
+        Args:
+            content_hash: Hex digest of the raw content
+            status: Only match resumes with this ingestion status
+
+        Returns:
+            Database ID of a matching resume, or None
+        """
+        cursor = self.conn.cursor()
+        if status:
+            cursor.execute(
+                "SELECT id FROM resumes WHERE content_hash = ? "
+                "AND ingestion_status = ? LIMIT 1",
+                (content_hash, status),
+            )
+        else:
+            cursor.execute(
+                "SELECT id FROM resumes WHERE content_hash = ? LIMIT 1",
+                (content_hash,),
+            )
+        row = cursor.fetchone()
+
+        return row[0] if row else None
+
     def get_all_resumes(
         self, status: Optional[str] = None, limit: Optional[int] = None
     ) -> List[ResumeDataModel]:
@@ -206,39 +272,72 @@ class ResumeStorageService:
         Returns:
             List of ResumeDataModel objects
         """
+        return list(self.iter_resumes(status, limit))
+
+    def iter_resumes(
+        self, status: Optional[str] = None, limit: Optional[int] = None
+    ) -> Iterator[ResumeDataModel]:
+        """
+        Stream resumes, optionally filtered by status, in batches from the cursor.
+
+        Args:
+            status: Filter by ingestion status (pending, completed, failed)
+            limit: Maximum number of resumes to return
+
+        Yields:
+            ResumeDataModel objects, newest first
+        """
         cursor = self.conn.cursor()
 
+        # LIMIT is always bound (-1 means unbounded) so the SQL text is stable
         if status:
-            query = "SELECT * FROM resumes WHERE ingestion_status = ? ORDER BY created_at DESC"
-            params = (status,)
+            query = "SELECT * FROM resumes WHERE ingestion_status = ? ORDER BY created_at DESC LIMIT ?"
+            params = (status, limit or -1)
         else:
-            query = "SELECT * FROM resumes ORDER BY created_at DESC"
-            params = ()
-
-        if limit:
-            query += f" LIMIT {limit}"
+            query = "SELECT * FROM resumes ORDER BY created_at DESC LIMIT ?"
+            params = (limit or -1,)
 
         cursor.execute(query, params)
-        rows = cursor.fetchall()
+        yield from _iter_models(cursor)
+
+    def iter_completed_resumes(
+        self, limit: Optional[int] = None, offset: int = 0
+    ) -> Iterator[Tuple[str, str, Optional[str]]]:
+        """
+        Stream lightweight listing rows for completed resumes.
+
+        Only the columns needed for selection menus are fetched, so the
+        resume content is never loaded, and rows are yielded straight from
+        the cursor instead of being collected first.
+
+        Args:
+            limit: Maximum number of resumes to return
+            offset: Number of resumes to skip
 
-        return [ResumeDataModel.from_dict(dict(row)) for row in rows]
+        Yields:
+            Tuples of (resume_id, file_name, ingested_at)
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "SELECT resume_id, file_name, ingested_at FROM resumes "
+            "WHERE ingestion_status = 'completed' ORDER BY ingested_at DESC "
+            "LIMIT ? OFFSET ?",
+            (limit or -1, offset),
+        )
+        for row in cursor:
+            yield tuple(row)
 
     def get_ingested_resumes(
         self, limit: Optional[int] = None
     ) -> List[ResumeDataModel]:
         """Get all successfully ingested resumes"""
         cursor = self.conn.cursor()
-        query = (
-            "SELECT * FROM resumes WHERE graph_ingested = 1 ORDER BY ingested_at DESC"
+        cursor.execute(
+            "SELECT * FROM resumes WHERE graph_ingested = 1 "
+            "ORDER BY ingested_at DESC LIMIT ?",
+            (limit or -1,),
         )
-
-        if limit:
-            query += f" LIMIT {limit}"
-
-        cursor.execute(query)
-        rows = cursor.fetchall()
-
-        return [ResumeDataModel.from_dict(dict(row)) for row in rows]
+        return list(_iter_models(cursor))
 
     def delete_resume(self, resume_id: str) -> bool:
         """
@@ -252,7 +351,6 @@ class ResumeStorageService:
         """
         cursor = self.conn.cursor()
         cursor.execute("DELETE FROM resumes WHERE resume_id = ?", (resume_id,))
-        self.conn.commit()
 
         return cursor.rowcount > 0
 
@@ -272,9 +370,36 @@ class ResumeStorageService:
     def close(self):
         """Close database connection"""
         if self.conn:
+            # Refresh planner statistics for tables whose size changed a lot
+            # since they were last analysed, so the composite indexes stay
+            # in use as the database grows
+            try:
+                self.conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass
             self.conn.close()
             self.conn = None
+        atexit.unregister(self.close)
+
+    def __enter__(self) -> "ResumeStorageService":
+        """Use the service as a context manager that closes on exit"""
+        return self
 
-    def __del__(self):
-        """Cleanup on deletion"""
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the connection when leaving the with block"""
         self.close()
+
+
+_SERVICE: Optional[ResumeStorageService] = None
+_SERVICE_LOCK = threading.Lock()
+
+
+def get_resume_storage() -> ResumeStorageService:
+    """Return the shared resume storage service, creating it on first use"""
+    global _SERVICE
+    # A closed service (e.g. after a with block) is replaced by a fresh one
+    if _SERVICE is None or _SERVICE.conn is None:
+        with _SERVICE_LOCK:
+            if _SERVICE is None or _SERVICE.conn is None:
+                _SERVICE = ResumeStorageService()
+    return _SERVICE
@@ -8,9 +8,29 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Tuple
 
-from ..providers.config import ProviderConfig
+from ..providers.config import ProviderConfig, create_litellm_config
 from .models import ProviderModel
 
+_INSERT_PROVIDER_SQL = (
+    f"INSERT INTO providers ({', '.join(ProviderModel.FIELD_ORDER)}) "
+    f"VALUES ({', '.join('?' * len(ProviderModel.FIELD_ORDER))})"
+)
+
+# Columns are listed explicitly (not SELECT *) because upgraded databases
+# have the embedding columns appended in ALTER TABLE order
+_SELECT_PROVIDER_SQL = (
+    f"SELECT id, {', '.join(ProviderModel.FIELD_ORDER)} FROM providers"
+)
+
+_UPDATE_PROVIDER_SQL = """
+    UPDATE providers SET
+        provider_type = ?, model = ?, api_key_env = ?, base_url = ?,
+        additional_params = ?, embedding_model = ?, embedding_api_key_env = ?,
+        embedding_base_url = ?, embedding_additional_params = ?,
+        is_active = ?, is_default = ?, updated_at = ?
+    WHERE id = ?
+"""
+
 
 class ProviderStateService:
     """Service for managing provider state persistence"""
@@ -34,11 +54,19 @@ class ProviderStateService:
         self.db_path = Path.home() / ".resumemind" / "providers.db"
         self.db_path.parent.mkdir(exist_ok=True)
         self._initialized = True
+
+        # One connection for the lifetime of the singleton; calls are
+        # serialized through the class lock
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA synchronous=NORMAL")
         self._init_database()
 
     def _init_database(self):
         """Initialize the database schema"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self.conn as conn:
+            # WAL mode is persistent in the database file, so set it once here
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS providers (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -111,7 +139,7 @@ class ProviderStateService:
             config, is_active, is_default
         )
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self.conn as conn:
             # If setting as default, unset other defaults
             if is_default:
                 conn.execute("UPDATE providers SET is_default = FALSE")
@@ -127,18 +155,11 @@ class ProviderStateService:
 
             if existing:
                 # Update existing provider
+                # updated_at was already stamped by from_provider_config
                 provider_model.id = existing[0]
-                provider_model.updated_at = datetime.now().isoformat()
 
                 conn.execute(
-                    """
-                    UPDATE providers SET 
-                        provider_type = ?, model = ?, api_key_env = ?, base_url = ?,
-                        additional_params = ?, embedding_model = ?, embedding_api_key_env = ?,
-                        embedding_base_url = ?, embedding_additional_params = ?,
-                        is_active = ?, is_default = ?, updated_at = ?
-                    WHERE id = ?
-                """,
+                    _UPDATE_PROVIDER_SQL,
                     (
                         provider_model.provider_type,
                         provider_model.model,
@@ -159,97 +180,80 @@ class ProviderStateService:
                 return provider_model.id
             else:
                 # Insert new provider
-                cursor = conn.execute(
-                    """
-                    INSERT INTO providers 
-                    (name, provider_type, model, api_key_env, base_url, additional_params,
-                     embedding_model, embedding_api_key_env, embedding_base_url, embedding_additional_params,
-                     is_active, is_default, created_at, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        provider_model.name,
-                        provider_model.provider_type,
-                        provider_model.model,
-                        provider_model.api_key_env,
-                        provider_model.base_url,
-                        provider_model.additional_params,
-                        provider_model.embedding_model,
-                        provider_model.embedding_api_key_env,
-                        provider_model.embedding_base_url,
-                        provider_model.embedding_additional_params,
-                        provider_model.is_active,
-                        provider_model.is_default,
-                        provider_model.created_at,
-                        provider_model.updated_at,
-                    ),
-                )
+                cursor = conn.execute(_INSERT_PROVIDER_SQL, provider_model.to_params())
 
                 return cursor.lastrowid
 
     def get_all_providers(self) -> List[ProviderModel]:
         """Get all saved providers"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("""
-                SELECT * FROM providers ORDER BY is_default DESC, is_active DESC, updated_at DESC
-            """)
+        with self._lock, self.conn as conn:
+            cursor = conn.execute(
+                _SELECT_PROVIDER_SQL
+                + " ORDER BY is_default DESC, is_active DESC, updated_at DESC"
+            )
 
-            return [ProviderModel.from_dict(dict(row)) for row in cursor.fetchall()]
+            return [ProviderModel.from_row(row) for row in cursor.fetchall()]
+
+    def snapshot(self) -> Tuple[List[ProviderModel], Optional[ProviderModel]]:
+        """
+        Get all providers and the active one with a single query.
+
+        Returns:
+            Tuple of (providers ordered as in get_all_providers, active provider)
+        """
+        providers = self.get_all_providers()
+        active = next((provider for provider in providers if provider.is_active), None)
+        return providers, active
 
     def get_active_provider(self) -> Optional[ProviderModel]:
         """Get the currently active provider"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._lock, self.conn as conn:
             cursor = conn.execute(
-                "SELECT * FROM providers WHERE is_active = TRUE LIMIT 1"
+                _SELECT_PROVIDER_SQL + " WHERE is_active = TRUE LIMIT 1"
             )
             row = cursor.fetchone()
 
             if row:
-                return ProviderModel.from_dict(dict(row))
+                return ProviderModel.from_row(row)
             return None
 
     def get_default_provider(self) -> Optional[ProviderModel]:
         """Get the default provider"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._lock, self.conn as conn:
             cursor = conn.execute(
-                "SELECT * FROM providers WHERE is_default = TRUE LIMIT 1"
+                _SELECT_PROVIDER_SQL + " WHERE is_default = TRUE LIMIT 1"
             )
             row = cursor.fetchone()
 
             if row:
-                return ProviderModel.from_dict(dict(row))
+                return ProviderModel.from_row(row)
             return None
 
     def get_provider_by_id(self, provider_id: int) -> Optional[ProviderModel]:
         """Get a provider by its ID"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._lock, self.conn as conn:
             cursor = conn.execute(
-                "SELECT * FROM providers WHERE id = ?", (provider_id,)
+                _SELECT_PROVIDER_SQL + " WHERE id = ?", (provider_id,)
             )
             row = cursor.fetchone()
 
             if row:
-                return ProviderModel.from_dict(dict(row))
+                return ProviderModel.from_row(row)
             return None
 
     def get_provider_by_name(self, name: str) -> Optional[ProviderModel]:
         """Get a provider by its name"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("SELECT * FROM providers WHERE name = ?", (name,))
+        with self._lock, self.conn as conn:
+            cursor = conn.execute(_SELECT_PROVIDER_SQL + " WHERE name = ?", (name,))
             row = cursor.fetchone()
 
             if row:
-                return ProviderModel.from_dict(dict(row))
+                return ProviderModel.from_row(row)
             return None
 
     def set_active_provider(self, provider_id: int) -> bool:
         """Set a provider as active"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self.conn as conn:
             # First, unset all active providers
             conn.execute("UPDATE providers SET is_active = FALSE")
 
@@ -263,7 +267,7 @@ class ProviderStateService:
 
     def set_default_provider(self, provider_id: int) -> bool:
         """Set a provider as default"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self.conn as conn:
             # First, unset all default providers
             conn.execute("UPDATE providers SET is_default = FALSE")
 
@@ -277,7 +281,7 @@ class ProviderStateService:
 
     def delete_provider(self, provider_id: int) -> bool:
         """Delete a provider"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self.conn as conn:
             cursor = conn.execute("DELETE FROM providers WHERE id = ?", (provider_id,))
             return cursor.rowcount > 0
 
@@ -291,26 +295,23 @@ class ProviderStateService:
 
         config = provider_model.to_provider_config()
 
-        # Create LiteLLM config
-        litellm_config = {"model": config.model}
-        if config.api_key_env:
-            litellm_config["api_key"] = config.api_key_env
-        if config.base_url:
-            litellm_config["api_base"] = config.base_url
-        if config.additional_params:
-            litellm_config.update(config.additional_params)
-
-        return config, litellm_config
+        return config, create_litellm_config(config)
 
     def has_providers(self) -> bool:
         """Check if any providers are saved"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self.conn as conn:
             cursor = conn.execute("SELECT COUNT(*) FROM providers")
             count = cursor.fetchone()[0]
             return count > 0
 
     def clear_all_providers(self) -> int:
         """Clear all providers from the database"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self.conn as conn:
             cursor = conn.execute("DELETE FROM providers")
             return cursor.rowcount
+
+    def close(self):
+        """Close the database connection"""
+        if self.conn:
+            self.conn.close()
+            self.conn = None
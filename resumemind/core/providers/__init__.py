@@ -3,7 +3,7 @@ LLM Provider management and configuration
 """
 
 from .base import ProviderType
-from .config import ProviderConfig
+from .config import ProviderConfig, create_litellm_config
 from .registry import LLMProviders
 
-__all__ = ["LLMProviders", "ProviderConfig", "ProviderType"]
+__all__ = ["LLMProviders", "ProviderConfig", "ProviderType", "create_litellm_config"]
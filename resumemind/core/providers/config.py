@@ -2,13 +2,20 @@
 Provider configuration data classes
 """
 
-from dataclasses import dataclass
+import json
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 from .base import ProviderType
 
 
-@dataclass
+def _params_json(params: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Encode params as JSON, or None when there are none"""
+    return json.dumps(params) if params else None
+
+
+@dataclass(slots=True, frozen=True)
 class ProviderConfig:
     """Configuration for an LLM provider with embedding support"""
 
@@ -17,10 +24,65 @@ class ProviderConfig:
     model: str
     api_key_env: Optional[str] = None
     base_url: Optional[str] = None
-    additional_params: Optional[Dict[str, Any]] = None
+    # Dict fields are left out of the hash so configs stay hashable
+    additional_params: Optional[Dict[str, Any]] = field(default=None, hash=False)
 
     # Embedding configuration
     embedding_model: Optional[str] = None
     embedding_api_key_env: Optional[str] = None
     embedding_base_url: Optional[str] = None
-    embedding_additional_params: Optional[Dict[str, Any]] = None
+    embedding_additional_params: Optional[Dict[str, Any]] = field(
+        default=None, hash=False
+    )
+
+    # JSON encodings of the params, computed once since the config is frozen
+    _additional_params_json: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _embedding_additional_params_json: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, "_additional_params_json", _params_json(self.additional_params)
+        )
+        object.__setattr__(
+            self,
+            "_embedding_additional_params_json",
+            _params_json(self.embedding_additional_params),
+        )
+
+    @property
+    def additional_params_json(self) -> Optional[str]:
+        """additional_params encoded as JSON"""
+        return self._additional_params_json
+
+    @property
+    def embedding_additional_params_json(self) -> Optional[str]:
+        """embedding_additional_params encoded as JSON"""
+        return self._embedding_additional_params_json
+
+
+@lru_cache(maxsize=32)
+def create_litellm_config(config: ProviderConfig) -> Dict[str, Any]:
+    """
+    Build the LiteLLM keyword arguments for a provider configuration.
+
+    Configs are frozen and hashable, so the result is cached per config; the
+    returned dict is shared between callers and must not be modified.
+
+    Args:
+        config: Provider configuration
+
+    Returns:
+        Dictionary with model, api_key, api_base and any additional params
+    """
+    litellm_config = {"model": config.model}
+    if config.api_key_env:
+        litellm_config["api_key"] = config.api_key_env
+    if config.base_url:
+        litellm_config["api_base"] = config.base_url
+    if config.additional_params:
+        litellm_config.update(config.additional_params)
+    return litellm_config
@@ -2,25 +2,126 @@
 Provider management interface for handling multiple providers
 """
 
-from typing import List, Optional, Tuple
+from datetime import datetime
+from functools import lru_cache
+from typing import Iterator, List, Optional, Tuple
 
 from rich.console import Console
+from rich.live import Live
 from rich.prompt import Confirm, IntPrompt, Prompt
 from rich.table import Table
+from rich.text import Text
 
-from ..persistence import ProviderStateService
+from ..persistence import ProviderModel, ProviderStateService
 from ..utils import DisplayManager
 from .config import ProviderConfig
 from .registry import LLMProviders
 
+# Rows shown in the providers table; the rest are summarized in one line
+MAX_PROVIDER_ROWS = 50
+
+# Rows added between refreshes when streaming a long providers table
+PROVIDER_ROW_BATCH = 20
+
+_MAIN_MENU_OPTIONS = (
+    ("1", "🚀 Use existing provider"),
+    ("2", "➕ Add new provider"),
+    ("3", "⚙️  Manage providers"),
+    ("4", "❌ Exit"),
+)
+_MAIN_MENU_CHOICES = [key for key, _ in _MAIN_MENU_OPTIONS]
+
+_MANAGE_MENU_OPTIONS = (
+    ("1", "🎯 Set active provider"),
+    ("2", "⭐ Set default provider"),
+    ("3", "🗑️  Delete provider"),
+    ("4", "🔄 Refresh list"),
+    ("5", "⬅️  Back to main menu"),
+)
+_MANAGE_MENU_CHOICES = [key for key, _ in _MANAGE_MENU_OPTIONS]
+
+# Static menus, parsed from markup once and printed with a single call
+_MAIN_MENU = Text.from_markup(
+    "\n[bold]Available Actions:[/bold]\n"
+    + "\n".join(f"  {key}. {label}" for key, label in _MAIN_MENU_OPTIONS)
+)
+
+_MANAGE_MENU = Text.from_markup(
+    "\n[bold]Management Actions:[/bold]\n"
+    + "\n".join(f"  {key}. {label}" for key, label in _MANAGE_MENU_OPTIONS)
+)
+
+# Providers table layout: (header, style, width, justify)
+_TABLE_COLUMNS = (
+    ("ID", "dim", 4, "left"),
+    ("Name", "cyan", None, "left"),
+    ("Model", "green", None, "left"),
+    ("Provider", "blue", None, "left"),
+    ("Status", None, None, "center"),
+    ("Last Updated", "dim", None, "left"),
+)
+
+
+@lru_cache(maxsize=256)
+def _fmt_updated(updated_at: str) -> str:
+    """Format an ISO timestamp for the Last Updated column"""
+    try:
+        return datetime.fromisoformat(updated_at).strftime("%m/%d %H:%M")
+    except Exception:
+        return "Unknown"
+
 
 class ProviderManager:
     """Manages multiple LLM providers with persistence"""
 
+    # Static help banners, parsed from markup once
+    _LLM_CONFIG_BANNER = Text.from_markup(
+        "[dim]Configure any model supported by LiteLLM. Examples:[/dim]\n"
+        "[dim]• OpenAI: gpt-4o, gpt-4, gpt-3.5-turbo[/dim]\n"
+        "[dim]• Anthropic: claude-3-5-sonnet-20241022, claude-3-opus-20240229[/dim]\n"
+        "[dim]• Google: gemini/gemini-1.5-pro, gemini/gemini-pro[/dim]\n"
+        "[dim]• Ollama: ollama/llama3.2, ollama/mistral[/dim]\n"
+        "[dim]• And many more providers supported by LiteLLM[/dim]\n"
+    )
+
+    _EMBEDDING_CONFIG_BANNER = Text.from_markup(
+        "\n[bold cyan]🔍 Embedding Configuration[/bold cyan]\n"
+        "[dim]Configure embedding model for GraphRAG support:[/dim]\n"
+        "[dim]• Leave empty for auto-selection based on your LLM model[/dim]\n"
+        "[dim]• OpenAI: text-embedding-3-small, text-embedding-3-large[/dim]\n"
+        "[dim]• Ollama: ollama/nomic-embed-text, ollama/mxbai-embed-large[/dim]\n"
+        "[dim]• Google: text-embedding-004[/dim]\n"
+    )
+
     def __init__(self):
         self.state_service = ProviderStateService()
         self.display = DisplayManager()
-        self.console = Console()
+
+        # Provider list and active provider, refetched only after a mutation
+        self._providers_cache: Optional[List[ProviderModel]] = None
+        self._active_cache: Optional[ProviderModel] = None
+        self._dirty = True
+
+    @property
+    def console(self) -> Console:
+        """Share the display manager's console instead of creating a second one"""
+        return self.display.console
+
+    def _refresh_cache(self):
+        """Reload the cached providers if a mutation invalidated them"""
+        if self._dirty:
+            self._providers_cache, self._active_cache = self.state_service.snapshot()
+            self._dirty = False
+
+    def _get_providers_cached(self) -> List[ProviderModel]:
+        """Get all saved providers, hitting the database only when stale"""
+        self._refresh_cache()
+        return self._providers_cache
+
+    def _get_active_cached(self) -> Optional[ProviderModel]:
+        """Get the active provider, hitting the database only when stale"""
+        self._refresh_cache()
+        return self._active_cache
 
     def get_or_create_provider(self) -> Optional[Tuple[ProviderConfig, dict]]:
         """
@@ -29,6 +130,9 @@ class ProviderManager:
         Returns:
             Tuple of (ProviderConfig, litellm_config) or None if cancelled
         """
+        # Start each menu session from fresh data; redraws within it are cached
+        self._dirty = True
+
         # Check if we have any saved providers
         if not self.state_service.has_providers():
             self.display.print(
@@ -45,23 +149,18 @@ class ProviderManager:
             self.display.print("\n[bold cyan]🤖 Provider Management[/bold cyan]")
 
             # Get all providers
-            providers = self.state_service.get_all_providers()
-            active_provider = self.state_service.get_active_provider()
+            providers = self._get_providers_cached()
+            active_provider = self._get_active_cached()
 
             if providers:
                 self._display_providers_table(providers, active_provider)
 
             # Show menu options
-            self.display.print("\n[bold]Available Actions:[/bold]")
-            self.display.print("  1. 🚀 Use existing provider")
-            self.display.print("  2. ➕ Add new provider")
-            self.display.print("  3. ⚙️  Manage providers")
-            self.display.print("  4. ❌ Exit")
+            self.display.print(_MAIN_MENU)
 
+            default_choice = "1" if providers else "2"
             choice = Prompt.ask(
-                "\nSelect an option",
-                choices=["1", "2", "3", "4"],
-                default="1" if providers else "2",
+                "\nSelect an option", choices=_MAIN_MENU_CHOICES, default=default_choice
             )
 
             if choice == "1":
@@ -70,7 +169,9 @@ class ProviderManager:
                         "[yellow]No providers available. Please add a provider first.[/yellow]"
                     )
                     continue
-                return self._select_existing_provider(providers)
+                result = self._select_existing_provider(providers)
+                if result:
+                    return result
 
             elif choice == "2":
                 result = self._create_new_provider()
@@ -88,42 +189,29 @@ class ProviderManager:
             elif choice == "4":
                 return None
 
-    def _display_providers_table(self, providers: List, active_provider: Optional):
-        """Display providers in a formatted table"""
-        table = Table(
-            title="Saved Providers", show_header=True, header_style="bold magenta"
-        )
-        table.add_column("ID", style="dim", width=4)
-        table.add_column("Name", style="cyan")
-        table.add_column("Model", style="green")
-        table.add_column("Provider", style="blue")
-        table.add_column("Status", justify="center")
-        table.add_column("Last Updated", style="dim")
-
-        for provider in providers:
-            status_icons = []
-            if provider.is_active or (
-                active_provider and provider.id == active_provider.id
-            ):
-                status_icons.append("🟢 Active")
-            if provider.is_default:
-                status_icons.append("⭐ Default")
-
-            status = " ".join(status_icons) if status_icons else "⚪ Inactive"
+    def _provider_rows(
+        self, providers: List, active_provider: Optional
+    ) -> Iterator[Tuple[str, ...]]:
+        """Yield formatted table rows for the providers that are shown"""
+        active_id = active_provider.id if active_provider else None
+        for provider in providers[:MAX_PROVIDER_ROWS]:
+            is_active = provider.is_active or provider.id == active_id
+            if is_active and provider.is_default:
+                status = "🟢 Active ⭐ Default"
+            elif is_active:
+                status = "🟢 Active"
+            elif provider.is_default:
+                status = "⭐ Default"
+            else:
+                status = "⚪ Inactive"
 
             # Format last updated
             if provider.updated_at:
-                from datetime import datetime
-
-                try:
-                    updated = datetime.fromisoformat(provider.updated_at)
-                    updated_str = updated.strftime("%m/%d %H:%M")
-                except Exception:
-                    updated_str = "Unknown"
+                updated_str = _fmt_updated(provider.updated_at)
             else:
                 updated_str = "Unknown"
 
-            table.add_row(
+            yield (
                 str(provider.id),
                 provider.name,
                 provider.model,
@@ -132,14 +220,45 @@ class ProviderManager:
                 updated_str,
             )
 
-        self.console.print(table)
+    def _display_providers_table(self, providers: List, active_provider: Optional):
+        """Display providers in a formatted table"""
+        rows = self._provider_rows(providers, active_provider)
+
+        if not self.console.is_terminal:
+            # Piped output: plain tab-separated lines, skipping table layout
+            lines = ["\t".join(column[0] for column in _TABLE_COLUMNS)]
+            lines.extend("\t".join(row) for row in rows)
+            self.console.out("\n".join(lines), highlight=False)
+        else:
+            table = Table(
+                title="Saved Providers", show_header=True, header_style="bold magenta"
+            )
+            for header, style, width, justify in _TABLE_COLUMNS:
+                table.add_column(header, style=style, width=width, justify=justify)
+
+            if len(providers) <= PROVIDER_ROW_BATCH:
+                for row in rows:
+                    table.add_row(*row)
+                self.console.print(table)
+            else:
+                # Show the first rows right away and grow the table in batches
+                with Live(table, console=self.console, auto_refresh=False) as live:
+                    for count, row in enumerate(rows, 1):
+                        table.add_row(*row)
+                        if count % PROVIDER_ROW_BATCH == 0:
+                            live.refresh()
+                    live.refresh()
+
+        hidden = len(providers) - MAX_PROVIDER_ROWS
+        if hidden > 0:
+            self.display.print(f"[dim]... {hidden} more providers not shown[/dim]")
 
     def _select_existing_provider(
         self, providers: List
     ) -> Optional[Tuple[ProviderConfig, dict]]:
         """Select an existing provider to use"""
         # Check if there's an active provider
-        active_provider = self.state_service.get_active_provider()
+        active_provider = self._get_active_cached()
         if active_provider:
             use_active = Confirm.ask(
                 f"\nUse currently active provider '{active_provider.name}'?",
@@ -154,34 +273,30 @@ class ProviderManager:
 
         # Let user select a provider
         self.display.print("\n[bold]Select a provider to use:[/bold]")
+        id_choices = [str(p.id) for p in providers if p.id]
+        by_id = {p.id: p for p in providers}
 
-        while True:
-            try:
-                provider_id = IntPrompt.ask(
-                    "Enter provider ID", choices=[str(p.id) for p in providers if p.id]
-                )
-
-                # Set as active and get config
-                if self.state_service.set_active_provider(provider_id):
-                    result = self.state_service.get_provider_config_and_litellm(
-                        provider_id
-                    )
-                    if result:
-                        provider_name = next(
-                            p.name for p in providers if p.id == provider_id
-                        )
-                        self.display.print(
-                            f"[green]✅ Activated provider: {provider_name}[/green]"
-                        )
-                        return result
+        # IntPrompt re-asks on invalid input itself; any other failure goes
+        # back to the provider menu instead of looping here
+        try:
+            provider_id = IntPrompt.ask("Enter provider ID", choices=id_choices)
+        except KeyboardInterrupt:
+            self.display.print("\n[yellow]Selection cancelled[/yellow]")
+            return None
 
+        # Set as active and get config
+        if self.state_service.set_active_provider(provider_id):
+            self._dirty = True
+            result = self.state_service.get_provider_config_and_litellm(provider_id)
+            if result:
+                provider_name = by_id[provider_id].name
                 self.display.print(
-                    "[red]Failed to activate provider. Please try again.[/red]"
+                    f"[green]✅ Activated provider: {provider_name}[/green]"
                 )
+                return result
 
-            except (ValueError, KeyboardInterrupt):
-                if not Confirm.ask("Would you like to try again?", default=True):
-                    return None
+        self.display.print("[red]Failed to activate provider.[/red]")
+        return None
 
     def _create_new_provider(self) -> Optional[Tuple[ProviderConfig, dict]]:
         """Create a new provider configuration"""
@@ -207,6 +322,7 @@ class ProviderManager:
                 is_active=True,  # New providers are automatically active
                 is_default=is_default,
             )
+            self._dirty = True
 
             self.display.print(
                 f"[green]✅ Provider '{config.name}' saved successfully![/green]"
@@ -223,20 +339,7 @@ class ProviderManager:
         self,
     ) -> Tuple[Optional[ProviderConfig], Optional[dict]]:
         """Get custom model configuration from user"""
-        self.display.print(
-            "[dim]Configure any model supported by LiteLLM. Examples:[/dim]"
-        )
-        self.display.print("[dim]• OpenAI: gpt-4o, gpt-4, gpt-3.5-turbo[/dim]")
-        self.display.print(
-            "[dim]• Anthropic: claude-3-5-sonnet-20241022, claude-3-opus-20240229[/dim]"
-        )
-        self.display.print(
-            "[dim]• Google: gemini/gemini-1.5-pro, gemini/gemini-pro[/dim]"
-        )
-        self.display.print("[dim]• Ollama: ollama/llama3.2, ollama/mistral[/dim]")
-        self.display.print(
-            "[dim]• And many more providers supported by LiteLLM[/dim]\n"
-        )
+        self.display.print(self._LLM_CONFIG_BANNER)
 
         try:
             # Get provider name
@@ -274,20 +377,7 @@ class ProviderManager:
             )
 
             # Embedding Configuration
-            self.display.print("\n[bold cyan]🔍 Embedding Configuration[/bold cyan]")
-            self.display.print(
-                "[dim]Configure embedding model for GraphRAG support:[/dim]"
-            )
-            self.display.print(
-                "[dim]• Leave empty for auto-selection based on your LLM model[/dim]"
-            )
-            self.display.print(
-                "[dim]• OpenAI: text-embedding-3-small, text-embedding-3-large[/dim]"
-            )
-            self.display.print(
-                "[dim]• Ollama: ollama/nomic-embed-text, ollama/mxbai-embed-large[/dim]"
-            )
-            self.display.print("[dim]• Google: text-embedding-004[/dim]\n")
+            self.display.print(self._EMBEDDING_CONFIG_BANNER)
 
             embedding_model = Prompt.ask("Enter embedding model (optional)", default="")
             embedding_api_key = Prompt.ask(
@@ -300,7 +390,7 @@ class ProviderManager:
                 default="",
             )
 
-            # Create config with the custom name
+            # Create config with the user-provided name
             config, litellm_config = LLMProviders.create_custom_config(
                 model=model,
                 api_key=api_key if api_key else None,
@@ -308,11 +398,9 @@ class ProviderManager:
                 embedding_model=embedding_model if embedding_model else None,
                 embedding_api_key=embedding_api_key if embedding_api_key else None,
                 embedding_base_url=embedding_base_url if embedding_base_url else None,
+                name=provider_name,
             )
 
-            # Update the config name to use the user-provided name
-            config.name = provider_name
-
             return config, litellm_config
 
         except KeyboardInterrupt:
@@ -321,21 +409,18 @@ class ProviderManager:
 
     def _manage_providers(self, providers: List):
         """Manage existing providers"""
+        rendered = None
         while True:
-            self.display.print("\n[bold cyan]⚙️  Provider Management[/bold cyan]")
-            self._display_providers_table(
-                providers, self.state_service.get_active_provider()
-            )
+            # Only redraw the table when the last action changed the data
+            if self._dirty or self._providers_cache is not rendered:
+                self.display.print("\n[bold cyan]⚙️  Provider Management[/bold cyan]")
+                providers = rendered = self._get_providers_cached()
+                self._display_providers_table(providers, self._get_active_cached())
 
-            self.display.print("\n[bold]Management Actions:[/bold]")
-            self.display.print("  1. 🎯 Set active provider")
-            self.display.print("  2. ⭐ Set default provider")
-            self.display.print("  3. 🗑️  Delete provider")
-            self.display.print("  4. 🔄 Refresh list")
-            self.display.print("  5. ⬅️  Back to main menu")
+            self.display.print(_MANAGE_MENU)
 
             choice = Prompt.ask(
-                "Select an action", choices=["1", "2", "3", "4", "5"], default="5"
+                "Select an action", choices=_MANAGE_MENU_CHOICES, default="5"
             )
 
             if choice == "1":
@@ -347,20 +432,22 @@ class ProviderManager:
                 if not providers:  # If no providers left, return to main menu
                     break
             elif choice == "4":
-                providers = self.state_service.get_all_providers()
+                self._dirty = True
             elif choice == "5":
                 break
 
     def _set_active_provider(self, providers: List):
         """Set a provider as active"""
+        id_choices = [str(p.id) for p in providers if p.id]
+        by_id = {p.id: p for p in providers}
         try:
             provider_id = IntPrompt.ask(
-                "Enter provider ID to set as active",
-                choices=[str(p.id) for p in providers if p.id],
+                "Enter provider ID to set as active", choices=id_choices
             )
 
             if self.state_service.set_active_provider(provider_id):
-                provider_name = next(p.name for p in providers if p.id == provider_id)
+                self._dirty = True
+                provider_name = by_id[provider_id].name
                 self.display.print(
                     f"[green]✅ Set '{provider_name}' as active provider[/green]"
                 )
@@ -372,14 +459,16 @@ class ProviderManager:
 
     def _set_default_provider(self, providers: List):
         """Set a provider as default"""
+        id_choices = [str(p.id) for p in providers if p.id]
+        by_id = {p.id: p for p in providers}
         try:
             provider_id = IntPrompt.ask(
-                "Enter provider ID to set as default",
-                choices=[str(p.id) for p in providers if p.id],
+                "Enter provider ID to set as default", choices=id_choices
             )
 
             if self.state_service.set_default_provider(provider_id):
-                provider_name = next(p.name for p in providers if p.id == provider_id)
+                self._dirty = True
+                provider_name = by_id[provider_id].name
                 self.display.print(
                     f"[green]✅ Set '{provider_name}' as default provider[/green]"
                 )
@@ -391,13 +480,14 @@ class ProviderManager:
 
     def _delete_provider(self, providers: List) -> List:
         """Delete a provider"""
+        id_choices = [str(p.id) for p in providers if p.id]
+        by_id = {p.id: p for p in providers}
         try:
             provider_id = IntPrompt.ask(
-                "Enter provider ID to delete",
-                choices=[str(p.id) for p in providers if p.id],
+                "Enter provider ID to delete", choices=id_choices
             )
 
-            provider_to_delete = next(p for p in providers if p.id == provider_id)
+            provider_to_delete = by_id[provider_id]
 
             # Confirm deletion
             if not Confirm.ask(
@@ -408,11 +498,12 @@ class ProviderManager:
                 return providers
 
             if self.state_service.delete_provider(provider_id):
+                self._dirty = True
                 self.display.print(
                     f"[green]✅ Deleted provider '{provider_to_delete.name}'[/green]"
                 )
                 # Return updated list
-                return self.state_service.get_all_providers()
+                return self._get_providers_cached()
             else:
                 self.display.print("[red]Failed to delete provider[/red]")
                 return providers
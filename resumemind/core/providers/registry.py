@@ -2,11 +2,33 @@
 LLM Provider registry and management - Simplified for LiteLLM only
 """
 
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 
-from ..services.embedding_service import get_default_embedding_models
+from ..services.embedding_service import default_embedding_model_for
 from .base import ProviderType
-from .config import ProviderConfig
+from .config import ProviderConfig, create_litellm_config
+
+# Embedding model examples per provider; static, so built once and read-only
+_EMBEDDING_EXAMPLES: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+    {
+        "OpenAI": (
+            "text-embedding-3-small",
+            "text-embedding-3-large",
+            "text-embedding-ada-002",
+        ),
+        "Ollama": (
+            "ollama/nomic-embed-text",
+            "ollama/mxbai-embed-large",
+            "ollama/all-minilm",
+        ),
+        "Google": ("text-embedding-004", "text-embedding-gecko-001"),
+        "Custom": (
+            "text-embedding-3-small",  # Fallback
+            "custom/your-embedding-model",
+        ),
+    }
+)
 
 
 class LLMProviders:
@@ -21,22 +43,13 @@ class LLMProviders:
         embedding_model: Optional[str] = None,
         embedding_api_key: Optional[str] = None,
         embedding_base_url: Optional[str] = None,
+        name: Optional[str] = None,
     ) -> tuple[ProviderConfig, Dict[str, Any]]:
         """Create a custom model configuration with embedding support"""
 
         # Auto-select embedding model if not provided
         if not embedding_model:
-            default_models = get_default_embedding_models()
-            if "ollama" in model.lower():
-                embedding_model = default_models["ollama"]
-            elif "gpt" in model.lower() or "openai" in model.lower():
-                embedding_model = default_models["openai"]
-            elif "gemini" in model.lower():
-                embedding_model = default_models["gemini"]
-            elif "claude" in model.lower():
-                embedding_model = default_models["claude"]
-            else:
-                embedding_model = default_models["custom"]
+            embedding_model = default_embedding_model_for(model)
 
         # Use same credentials for embedding if not specified
         if not embedding_api_key:
@@ -45,7 +58,7 @@ class LLMProviders:
             embedding_base_url = base_url
 
         config = ProviderConfig(
-            name=f"Custom {model}",
+            name=name or f"Custom {model}",
             provider_type=ProviderType.LITELLM,
             model=model,
             base_url=base_url if base_url else None,
@@ -55,31 +68,9 @@ class LLMProviders:
             embedding_base_url=embedding_base_url,
         )
 
-        litellm_config = {"model": model}
-        if api_key:
-            litellm_config["api_key"] = api_key
-        if base_url:
-            litellm_config["api_base"] = base_url
-
-        return config, litellm_config
+        return config, create_litellm_config(config)
 
     @classmethod
-    def get_embedding_model_examples(cls) -> Dict[str, list]:
+    def get_embedding_model_examples(cls) -> Mapping[str, Tuple[str, ...]]:
         """Get embedding model examples for different providers"""
-        return {
-            "OpenAI": [
-                "text-embedding-3-small",
-                "text-embedding-3-large",
-                "text-embedding-ada-002",
-            ],
-            "Ollama": [
-                "ollama/nomic-embed-text",
-                "ollama/mxbai-embed-large",
-                "ollama/all-minilm",
-            ],
-            "Google": ["text-embedding-004", "text-embedding-gecko-001"],
-            "Custom": [
-                "text-embedding-3-small",  # Fallback
-                "custom/your-embedding-model",
-            ],
-        }
+        return _EMBEDDING_EXAMPLES
@@ -2,10 +2,141 @@
 Embedding service for generating vector embeddings for GraphRAG support using LiteLLM
 """
 
-from typing import Dict, List, Optional
+import asyncio
+import hashlib
+import heapq
+import json
+import math
+import os
+import random
+import re
+from collections import OrderedDict
+from operator import itemgetter, mul
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 
 import litellm
 
+# Token limits per embedding model, built once at import; read-only because
+# get_embedding_token_limits() hands the same mapping to every caller
+_EMBEDDING_TOKEN_LIMITS: Mapping[str, int] = MappingProxyType(
+    {
+        # OpenAI models
+        "text-embedding-3-small": 8191,
+        "text-embedding-3-large": 8191,
+        "text-embedding-ada-002": 8191,
+        # Google models
+        "text-embedding-004": 8000,  # Conservative limit for Gemini
+        "text-embedding-gecko-001": 8000,
+        # Ollama models (generally more flexible)
+        "ollama/nomic-embed-text": 8192,
+        "ollama/mxbai-embed-large": 8192,
+        "ollama/all-minilm": 8192,
+        # Default fallback
+        "default": 7000,  # Conservative default
+    }
+)
+
+# Default embedding model per provider family, built once at import
+_DEFAULT_EMBEDDING_MODELS: Mapping[str, str] = MappingProxyType(
+    {
+        "openai": "text-embedding-3-small",
+        "ollama": "ollama/nomic-embed-text",
+        "gemini": "text-embedding-004",
+        "claude": "text-embedding-3-small",  # Fallback to OpenAI
+        "custom": "text-embedding-3-small",  # Default fallback
+    }
+)
+
+# (substring of the lowercased LLM model name, default embedding key), checked
+# in order; used for both new custom configs and saved providers
+_EMBEDDING_FAMILY_TOKENS = (
+    ("ollama", "ollama"),
+    ("gpt", "openai"),
+    ("openai", "openai"),
+    ("gemini", "gemini"),
+    ("claude", "claude"),
+)
+
+# Embeddings already fetched this session, keyed by sha256 of the provider
+# settings (model, api_base, additional params) and the text, kept in LRU
+# order; shared by every EmbeddingService so repeated entity texts across
+# resumes skip the provider round-trip
+EMBEDDING_CACHE_SIZE = 4096
+_EMBEDDING_CACHE: OrderedDict[str, List[float]] = OrderedDict()
+
+# Sentence ending followed by a space or newline; _chunk_text breaks chunks
+# after the last match in its search window
+_SENTENCE_END = re.compile(r"[.!?][ \n]")
+
+# Upper bound, in seconds, of the random delay before each individual
+# embedding request so concurrent requests do not start in one burst
+EMBED_START_JITTER_SECONDS = 0.05
+
+# Per-request caps when packing texts into embedding sub-batches; OpenAI
+# accepts up to 2048 inputs, and ~28000 characters is ~7k tokens
+EMBEDDING_BATCH_MAX_ITEMS = 2048
+EMBEDDING_BATCH_MAX_CHARS = 28000
+
+
+def _pack_batches(texts: List[str]) -> Tuple[List[List[int]], List[int]]:
+    """
+    Greedily pack texts, in order, into sub-batches under the request caps.
+
+    Args:
+        texts: Texts to embed
+
+    Returns:
+        (batches, oversized): lists of text indices per sub-batch, and the
+        indices of texts that exceed EMBEDDING_BATCH_MAX_CHARS on their own
+    """
+    batches: List[List[int]] = []
+    oversized: List[int] = []
+    current: List[int] = []
+    current_chars = 0
+
+    for index, text in enumerate(texts):
+        size = len(text)
+        if size > EMBEDDING_BATCH_MAX_CHARS:
+            oversized.append(index)
+            continue
+        if current and (
+            len(current) >= EMBEDDING_BATCH_MAX_ITEMS
+            or current_chars + size > EMBEDDING_BATCH_MAX_CHARS
+        ):
+            batches.append(current)
+            current, current_chars = [], 0
+        current.append(index)
+        current_chars += size
+
+    if current:
+        batches.append(current)
+    return batches, oversized
+
+
+def _unit_vector(vec: List[float]) -> List[float]:
+    """Scale a vector to unit length; zero vectors are returned unchanged"""
+    norm = math.hypot(*vec)
+    if norm == 0:
+        return list(vec)
+    return [value / norm for value in vec]
+
+
+def _cache_get(key: str) -> Optional[List[float]]:
+    """Return a cached embedding and mark it most recently used"""
+    embedding = _EMBEDDING_CACHE.get(key)
+    if embedding is not None:
+        _EMBEDDING_CACHE.move_to_end(key)
+    return embedding
+
+
+def _cache_put(key: str, embedding: List[float]) -> None:
+    """Cache an embedding, evicting the least recently used beyond the cap"""
+    _EMBEDDING_CACHE[key] = embedding
+    _EMBEDDING_CACHE.move_to_end(key)
+    while len(_EMBEDDING_CACHE) > EMBEDDING_CACHE_SIZE:
+        _EMBEDDING_CACHE.popitem(last=False)
+
 
 class EmbeddingService:
     """Service for generating vector embeddings using LiteLLM for multi-provider support"""
@@ -16,6 +147,7 @@ class EmbeddingService:
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
         additional_params: Optional[Dict] = None,
+        max_concurrency: int = 8,
     ):
         """
         Initialize the embedding service.
@@ -25,16 +157,34 @@ class EmbeddingService:
             api_key: API key for the provider
             base_url: Optional base URL for API calls
             additional_params: Additional parameters for the provider
+            max_concurrency: Maximum embedding requests in flight when texts
+                are embedded individually
         """
         self.model = model
         self.api_key = api_key
         self.base_url = base_url
         self.additional_params = additional_params or {}
+        self.max_concurrency = max(1, max_concurrency)
+
+        # Everything besides the text that decides the embedding returned:
+        # the same model behind another api_base, or with other parameters
+        # such as dimensions, must not share cache entries
+        self._cache_namespace = json.dumps(
+            [model, base_url, self.additional_params], sort_keys=True, default=str
+        )
 
         # Get model-specific token limit
         token_limits = get_embedding_token_limits()
         self.max_tokens = token_limits.get(model, token_limits["default"])
 
+        # (snapshot of the mapping's items, entity names, unit vectors) for the
+        # last mapping searched by find_similar_entities, so stored vectors are
+        # normalised only once; the snapshot holds the vectors themselves, so
+        # any renamed, added, removed or replaced entry triggers a rebuild
+        self._similarity_index: Optional[
+            Tuple[List[Tuple[str, List[float]]], List[str], List[List[float]]]
+        ] = None
+
         # Configure LiteLLM
         if api_key:
             litellm.api_key = api_key
@@ -72,15 +222,12 @@ class EmbeddingService:
             if end < len(text):
                 # Look for sentence endings within the last 500 characters
                 search_start = max(start, end - 500)
-                sentence_end = -1
-
-                for delimiter in [". ", ".\n", "! ", "!\n", "? ", "?\n"]:
-                    pos = text.rfind(delimiter, search_start, end)
-                    if pos > sentence_end:
-                        sentence_end = pos + len(delimiter)
+                match = None
+                for match in _SENTENCE_END.finditer(text, search_start, end):
+                    pass
 
-                if sentence_end > start:
-                    end = sentence_end
+                if match is not None and match.end() > start:
+                    end = match.end()
 
             chunk = text[start:end].strip()
             if chunk:
@@ -90,6 +237,10 @@ class EmbeddingService:
 
         return chunks
 
+    def _cache_key(self, text: str) -> str:
+        """Key for the shared embedding cache: provider settings plus the text"""
+        return hashlib.sha256(f"{self._cache_namespace}|{text}".encode()).hexdigest()
+
     async def generate_embedding(self, text: str) -> List[float]:
         """
         Generate vector embedding for a single text with automatic chunking.
@@ -100,6 +251,18 @@ class EmbeddingService:
         Returns:
             Vector embedding as list of floats (averaged if chunked)
         """
+        key = self._cache_key(text)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+
+        embedding = await self._embed_text(text)
+        if embedding:
+            _cache_put(key, embedding)
+        return embedding
+
+    async def _embed_text(self, text: str) -> List[float]:
+        """Embed a single text, bypassing the cache"""
         try:
             # Check if text needs chunking
             chunks = self._chunk_text(text)
@@ -120,6 +283,7 @@ class EmbeddingService:
                     f"Text too large ({len(text)} chars), chunking into {len(chunks)} pieces"
                 )
                 chunk_embeddings = []
+                chunk_weights = []
 
                 for i, chunk in enumerate(chunks):
                     try:
@@ -131,6 +295,7 @@ class EmbeddingService:
                             **self.additional_params,
                         )
                         chunk_embeddings.append(response.data[0]["embedding"])
+                        chunk_weights.append(len(chunk))
                         print(f"Processed chunk {i + 1}/{len(chunks)}")
                     except Exception as e:
                         print(f"Failed to embed chunk {i + 1}: {e}")
@@ -139,15 +304,14 @@ class EmbeddingService:
                 if not chunk_embeddings:
                     return []
 
-                # Average the embeddings
-                avg_embedding = []
-                embedding_dim = len(chunk_embeddings[0])
-
-                for dim in range(embedding_dim):
-                    avg_value = sum(emb[dim] for emb in chunk_embeddings) / len(
-                        chunk_embeddings
-                    )
-                    avg_embedding.append(avg_value)
+                # Average the embeddings, weighted by chunk length so a short
+                # trailing chunk does not count as much as a full one; zip(*)
+                # transposes to per-dimension columns in C
+                total_weight = sum(chunk_weights)
+                avg_embedding = [
+                    sum(map(mul, column, chunk_weights)) / total_weight
+                    for column in zip(*chunk_embeddings)
+                ]
 
                 print(f"Averaged {len(chunk_embeddings)} chunk embeddings")
                 return avg_embedding
@@ -160,50 +324,125 @@ class EmbeddingService:
         """
         Generate vector embeddings for multiple texts in batch with chunking support.
 
+        Texts already in the embedding cache are not sent to the provider, and
+        repeated texts within the batch are embedded once.
+
         Args:
             texts: List of texts to embed
 
         Returns:
             List of vector embeddings
         """
-        try:
-            # Check if any texts need chunking
-            needs_chunking = any(len(text) > 28000 for text in texts)  # ~7k tokens
+        keys = [self._cache_key(text) for text in texts]
+        embeddings: List[Optional[List[float]]] = [_cache_get(key) for key in keys]
+
+        # Unique cache misses, in first-seen order
+        misses: Dict[str, str] = {}
+        for key, text, embedding in zip(keys, texts, embeddings):
+            if embedding is None:
+                misses.setdefault(key, text)
+
+        if misses:
+            fetched = dict(zip(misses, await self._embed_batch(list(misses.values()))))
+            for key, embedding in fetched.items():
+                if embedding:
+                    _cache_put(key, embedding)
+            embeddings = [
+                fetched.get(key, []) if embedding is None else embedding
+                for key, embedding in zip(keys, embeddings)
+            ]
+
+        return embeddings
+
+    async def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed texts in size-capped sub-batches, bypassing the cache.
 
-            if not needs_chunking:
-                # Process normally if all texts are small enough
-                response = await litellm.aembedding(
-                    model=self.model,
-                    input=texts,
-                    api_key=self.api_key,
-                    api_base=self.base_url,
-                    **self.additional_params,
-                )
-                return [data["embedding"] for data in response.data]
-            else:
-                # Process individually with chunking support
-                print(
-                    f"Some texts are large, processing {len(texts)} texts individually..."
-                )
-                embeddings = []
+        Texts are packed in order into requests of at most
+        EMBEDDING_BATCH_MAX_ITEMS items and EMBEDDING_BATCH_MAX_CHARS
+        characters; a text over the character cap is embedded on its own with
+        chunking. Requests run concurrently, at most max_concurrency at once.
 
-                for i, text in enumerate(texts):
-                    embedding = await self.generate_embedding(text)
-                    embeddings.append(embedding)
-                    if (i + 1) % 5 == 0:  # Progress update every 5 texts
-                        print(f"Processed {i + 1}/{len(texts)} texts")
+        Args:
+            texts: List of texts to embed
 
-                return embeddings
+        Returns:
+            List of vector embeddings in the same order as texts
+        """
+        embeddings: List[List[float]] = [[] for _ in texts]
+        batches, oversized = _pack_batches(texts)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def embed_group(indices: List[int]) -> None:
+            group = [texts[index] for index in indices]
+            try:
+                async with semaphore:
+                    response = await litellm.aembedding(
+                        model=self.model,
+                        input=group,
+                        api_key=self.api_key,
+                        api_base=self.base_url,
+                        **self.additional_params,
+                    )
+                results = [data["embedding"] for data in response.data]
+            except Exception as e:
+                print(f"Failed to generate batch embeddings: {e}")
+                # Fallback to individual processing
+                print("Falling back to individual processing...")
+                results = await self._embed_individually(group, semaphore=semaphore)
+            for index, embedding in zip(indices, results):
+                embeddings[index] = embedding
+
+        async def embed_oversized() -> None:
+            print(f"{len(oversized)} texts are large, processing them individually...")
+            results = await self._embed_individually(
+                [texts[index] for index in oversized],
+                report_progress=True,
+                semaphore=semaphore,
+            )
+            for index, embedding in zip(oversized, results):
+                embeddings[index] = embedding
 
-        except Exception as e:
-            print(f"Failed to generate batch embeddings: {e}")
-            # Fallback to individual processing
-            print("Falling back to individual processing...")
-            embeddings = []
-            for text in texts:
+        tasks = [embed_group(indices) for indices in batches]
+        if oversized:
+            tasks.append(embed_oversized())
+        await asyncio.gather(*tasks)
+        return embeddings
+
+    async def _embed_individually(
+        self,
+        texts: List[str],
+        report_progress: bool = False,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> List[List[float]]:
+        """
+        Embed texts one request each, at most max_concurrency in flight.
+
+        Args:
+            texts: List of texts to embed
+            report_progress: Print a progress line every 5 completed texts
+            semaphore: Concurrency limit shared with other requests, if any
+
+        Returns:
+            List of vector embeddings in the same order as texts
+        """
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+        completed = 0
+
+        async def embed_one(text: str) -> List[float]:
+            nonlocal completed
+            # Stagger request starts so a burst does not trip rate limits; the
+            # delay runs before acquiring a slot so sleepers don't hold one
+            await asyncio.sleep(random.uniform(0, EMBED_START_JITTER_SECONDS))
+            async with semaphore:
                 embedding = await self.generate_embedding(text)
-                embeddings.append(embedding)
-            return embeddings
+            completed += 1
+            if report_progress and completed % 5 == 0:
+                print(f"Processed {completed}/{len(texts)} texts")
+            return embedding
+
+        return list(await asyncio.gather(*(embed_one(text) for text in texts)))
 
     async def embed_graph_data(self, graph_data, resume_content: str):
         """
@@ -211,7 +450,8 @@ class EmbeddingService:
 
         Args:
             graph_data: ResumeGraphExtractionOutput object
-            resume_content: Original resume content for context
+            resume_content: Original resume content (kept for API compatibility;
+                not embedded)
 
         Returns:
             Updated ResumeGraphExtractionOutput with embeddings
@@ -220,8 +460,8 @@ class EmbeddingService:
         texts_to_embed = []
         text_mappings = {}  # Maps text index to (type, identifier)
 
-        # Use shorter context to avoid token limits
-        # short_context = resume_content[:200] if resume_content else ""
+        # Texts carry no shared resume-content prefix: repeating it in every
+        # entity text would multiply the tokens sent to the embedding endpoint
 
         # Add triplet descriptions (more concise)
         for i, triplet in enumerate(graph_data.triplets):
@@ -281,6 +521,7 @@ class EmbeddingService:
         self.last_triplet_subject_embeddings = triplet_subject_embeddings
         self.last_triplet_object_embeddings = triplet_object_embeddings
         self.last_triplet_relationship_embeddings = triplet_relationship_embeddings
+        self.invalidate_similarity_index()
 
         return graph_data
 
@@ -290,6 +531,10 @@ class EmbeddingService:
         """
         Find entities similar to a query text using cosine similarity.
 
+        The normalised index of entity_embeddings is reused while its entries
+        are unchanged and rebuilt otherwise. A vector list mutated in place is
+        not detected; call invalidate_similarity_index() after doing that.
+
         Args:
             query_text: Text to search for
             entity_embeddings: Dictionary of entity names to embeddings
@@ -302,28 +547,44 @@ class EmbeddingService:
         if not query_embedding:
             return []
 
-        similarities = []
-        for entity_name, embedding in entity_embeddings.items():
-            if embedding:
-                similarity = self._cosine_similarity(query_embedding, embedding)
-                similarities.append((entity_name, similarity))
-
-        # Sort by similarity and return top k
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        return similarities[:top_k]
+        # With both sides unit length, cosine similarity is a plain dot product
+        query_unit = _unit_vector(query_embedding)
+        names, vectors = self._unit_index(entity_embeddings)
+        similarities = (
+            (entity_name, sum(map(mul, query_unit, vector)))
+            for entity_name, vector in zip(names, vectors)
+        )
+
+        # Partial selection of the top k instead of sorting every score
+        return heapq.nlargest(top_k, similarities, key=itemgetter(1))
+
+    def _unit_index(
+        self, entity_embeddings: Mapping[str, List[float]]
+    ) -> Tuple[List[str], List[List[float]]]:
+        """Return entity names and unit-length embeddings, cached per mapping"""
+        # O(N) check; list comparison short-circuits on identical vector objects
+        items = list(entity_embeddings.items())
+        index = self._similarity_index
+        if index is None or index[0] != items:
+            names = [name for name, embedding in items if embedding]
+            vectors = [_unit_vector(embedding) for _, embedding in items if embedding]
+            index = (items, names, vectors)
+            self._similarity_index = index
+        return index[1], index[2]
+
+    def invalidate_similarity_index(self) -> None:
+        """Drop the cached similarity index after a vector is mutated in place"""
+        self._similarity_index = None
 
     def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
         """Calculate cosine similarity between two vectors"""
-        import math
+        # map(mul) and hypot run the per-element work in C instead of
+        # three generator expressions
+        denominator = math.hypot(*vec1) * math.hypot(*vec2)
+        if denominator == 0:
+            return 0.0
 
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-        magnitude1 = math.sqrt(sum(a * a for a in vec1))
-        magnitude2 = math.sqrt(sum(a * a for a in vec2))
-
-        if magnitude1 == 0 or magnitude2 == 0:
-            return 0
-
-        return dot_product / (magnitude1 * magnitude2)
+        return sum(map(mul, vec1, vec2)) / denominator
 
 
 # Utility function to create embedding service from provider config
@@ -337,8 +598,6 @@ def create_embedding_service_from_provider(provider_config) -> EmbeddingService:
     Returns:
         EmbeddingService instance
     """
-    import os
-
     # Use embedding-specific configuration if available, otherwise fallback to main config
     embedding_model = provider_config.embedding_model
     embedding_api_key_env = provider_config.embedding_api_key_env
@@ -348,28 +607,7 @@ def create_embedding_service_from_provider(provider_config) -> EmbeddingService:
     # Fallback to main provider config if embedding config not specified
     if not embedding_model:
         # Auto-select embedding model based on main provider
-        if (
-            "openai" in provider_config.model.lower()
-            or provider_config.model.startswith("gpt")
-        ):
-            embedding_model = "text-embedding-3-small"
-        elif (
-            "ollama" in provider_config.model.lower()
-            or provider_config.model.startswith("ollama/")
-        ):
-            embedding_model = (
-                "ollama/nomic-embed-text"  # Popular Ollama embedding model
-            )
-        elif "gemini" in provider_config.model.lower():
-            embedding_model = (
-                "text-embedding-004"  # Google's embedding model via LiteLLM
-            )
-        elif "claude" in provider_config.model.lower():
-            # Anthropic doesn't have embeddings, fallback to OpenAI
-            embedding_model = "text-embedding-3-small"
-        else:
-            # Default fallback
-            embedding_model = "text-embedding-3-small"
+        embedding_model = default_embedding_model_for(provider_config.model)
 
     if not embedding_api_key_env:
         embedding_api_key_env = provider_config.api_key_env
@@ -377,10 +615,8 @@ def create_embedding_service_from_provider(provider_config) -> EmbeddingService:
     if not embedding_base_url:
         embedding_base_url = provider_config.base_url
 
-    # Extract API key from environment variable
-    api_key = None
-    if embedding_api_key_env:
-        api_key = os.getenv(embedding_api_key_env)
+    # Extract API key from environment variable (one lookup, only when named)
+    api_key = os.getenv(embedding_api_key_env) if embedding_api_key_env else None
 
     return EmbeddingService(
         model=embedding_model,
@@ -390,41 +626,39 @@ def create_embedding_service_from_provider(provider_config) -> EmbeddingService:
     )
 
 
-def get_default_embedding_models() -> Dict[str, str]:
+def get_default_embedding_models() -> Mapping[str, str]:
     """
     Get default embedding models for different providers.
 
     Returns:
-        Dictionary mapping provider types to default embedding models
+        Read-only mapping of provider types to default embedding models
     """
-    return {
-        "openai": "text-embedding-3-small",
-        "ollama": "ollama/nomic-embed-text",
-        "gemini": "text-embedding-004",
-        "claude": "text-embedding-3-small",  # Fallback to OpenAI
-        "custom": "text-embedding-3-small",  # Default fallback
-    }
+    return _DEFAULT_EMBEDDING_MODELS
+
+
+def default_embedding_model_for(model: str) -> str:
+    """
+    Pick the default embedding model for an LLM model name.
 
+    Args:
+        model: LLM model identifier, e.g. "gpt-4o" or "ollama/llama3.2"
 
-def get_embedding_token_limits() -> Dict[str, int]:
+    Returns:
+        Default embedding model for the model's provider family
+    """
+    model_lower = model.lower()
+    family = next(
+        (key for token, key in _EMBEDDING_FAMILY_TOKENS if token in model_lower),
+        "custom",
+    )
+    return _DEFAULT_EMBEDDING_MODELS[family]
+
+
+def get_embedding_token_limits() -> Mapping[str, int]:
     """
     Get token limits for different embedding models.
 
     Returns:
-        Dictionary mapping model names to their token limits
+        Read-only mapping of model names to their token limits
     """
-    return {
-        # OpenAI models
-        "text-embedding-3-small": 8191,
-        "text-embedding-3-large": 8191,
-        "text-embedding-ada-002": 8191,
-        # Google models
-        "text-embedding-004": 8000,  # Conservative limit for Gemini
-        "text-embedding-gecko-001": 8000,
-        # Ollama models (generally more flexible)
-        "ollama/nomic-embed-text": 8192,
-        "ollama/mxbai-embed-large": 8192,
-        "ollama/all-minilm": 8192,
-        # Default fallback
-        "default": 7000,  # Conservative default
-    }
+    return _EMBEDDING_TOKEN_LIMITS
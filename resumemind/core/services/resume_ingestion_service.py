@@ -1,5 +1,7 @@
 import hashlib
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 from markitdown import MarkItDown
 
@@ -8,7 +10,10 @@ from resumemind.core.agents.resume_graph_extraction_workflow import (
     ResumeGraphExtractionWorkflow,
 )
 from resumemind.core.persistence.resume_models import ResumeDataModel
-from resumemind.core.persistence.resume_storage_service import ResumeStorageService
+from resumemind.core.persistence.resume_storage_service import (
+    ResumeStorageService,
+    get_resume_storage,
+)
 from resumemind.core.providers.config import ProviderConfig
 from resumemind.core.services.embedding_service import (
     create_embedding_service_from_provider,
@@ -16,8 +21,14 @@ from resumemind.core.services.embedding_service import (
 from resumemind.core.services.graph_database_service import GraphDatabaseService
 
 
+@lru_cache(maxsize=1)
+def get_markdown_converter() -> MarkItDown:
+    """Return the shared MarkItDown converter, loading its plugins only once"""
+    return MarkItDown(enable_plugins=True)
+
+
 async def read_resume(resume_path: str) -> str:
-    md = MarkItDown(enable_plugins=True)
+    md = get_markdown_converter()
     resume_data = md.convert(resume_path)
     return resume_data.markdown
 
@@ -162,6 +173,35 @@ def generate_resume_id(resume_path: str) -> str:
     return f"resume_{resume_hash}"
 
 
+def find_ingested_duplicate(
+    storage_service: ResumeStorageService, content_hash: str
+) -> Optional[ResumeDataModel]:
+    """
+    Find an already ingested resume with identical raw content.
+
+    Args:
+        storage_service: Resume storage service
+        content_hash: SHA-256 hex digest of the raw resume content
+
+    Returns:
+        The completed resume with the same content hash, if any
+    """
+    existing_id = storage_service.content_hash_exists(content_hash, "completed")
+    if existing_id is None:
+        return None
+    return storage_service.get_resume_by_id(existing_id)
+
+
+def already_ingested_result(resume_model: ResumeDataModel) -> dict:
+    """Workflow result for a resume whose content was ingested before"""
+    return {
+        "success": False,
+        "error": "Resume content was already ingested",
+        "resume_id": resume_model.resume_id,
+        "already_ingested": True,
+    }
+
+
 async def complete_resume_ingestion_workflow_with_human_review(
     resume_path: str, provider_config: ProviderConfig, cli_interface
 ) -> dict:
@@ -177,17 +217,27 @@ async def complete_resume_ingestion_workflow_with_human_review(
         Dictionary with workflow results and statistics
     """
     # Initialize storage service
-    storage_service = ResumeStorageService()
+    storage_service = get_resume_storage()
     resume_model = None
 
     try:
         # Step 1: Read resume
         raw_content = await read_resume(resume_path)
+        # Hashed once: used for the duplicate check and stored on the model
+        content_hash = hashlib.sha256(raw_content.encode()).hexdigest()
+
+        # Identical content was already ingested; skip cleaning and extraction
+        duplicate = find_ingested_duplicate(storage_service, content_hash)
+        if duplicate:
+            return already_ingested_result(duplicate)
 
         # Step 2: Store raw content in database immediately
         resume_id = generate_resume_id(resume_path)
         resume_model = ResumeDataModel.from_file_data(
-            file_path=resume_path, raw_content=raw_content, resume_id=resume_id
+            file_path=resume_path,
+            raw_content=raw_content,
+            resume_id=resume_id,
+            content_hash=content_hash,
         )
         resume_model = storage_service.save_resume(resume_model)
         print(f"✅ Resume data saved to database (ID: {resume_model.resume_id})")
@@ -299,17 +349,27 @@ async def complete_resume_ingestion_workflow(
         Dictionary with workflow results and statistics
     """
     # Initialize storage service
-    storage_service = ResumeStorageService()
+    storage_service = get_resume_storage()
     resume_model = None
 
     try:
         # Step 1: Read resume
         raw_content = await read_resume(resume_path)
+        # Hashed once: used for the duplicate check and stored on the model
+        content_hash = hashlib.sha256(raw_content.encode()).hexdigest()
+
+        # Identical content was already ingested; skip cleaning and extraction
+        duplicate = find_ingested_duplicate(storage_service, content_hash)
+        if duplicate:
+            return already_ingested_result(duplicate)
 
         # Step 2: Store raw content in database immediately
         resume_id = generate_resume_id(resume_path)
         resume_model = ResumeDataModel.from_file_data(
-            file_path=resume_path, raw_content=raw_content, resume_id=resume_id
+            file_path=resume_path,
+            raw_content=raw_content,
+            resume_id=resume_id,
+            content_hash=content_hash,
         )
         resume_model = storage_service.save_resume(resume_model)
         print(f"✅ Resume data saved to database (ID: {resume_model.resume_id})")
@@ -5,7 +5,7 @@ Resume Optimization Service - Orchestrates resume optimization workflow
 from typing import Any, Dict, List, Optional
 
 from ..agents import ResumeOptimizationOutput, ResumeOptimizerWorkflow
-from ..persistence.resume_storage_service import ResumeStorageService
+from ..persistence.resume_storage_service import get_resume_storage
 from ..services.graph_database_service import GraphDatabaseService
 
 
@@ -25,7 +25,7 @@ class ResumeOptimizationService:
             base_url=base_url,
             additional_params=additional_params,
         )
-        self.resume_storage = ResumeStorageService()
+        self.resume_storage = get_resume_storage()
         self.graph_db = GraphDatabaseService()
 
     async def optimize_resume(